@@ -4,20 +4,36 @@
 
 from __future__ import annotations
 import argparse
+import asyncio
 import csv
+import gzip
+import json
+import multiprocessing
+import pickle
+import random
 import re
+import sqlite3
 import sys
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, Optional
 from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+import lxml.html
+from lxml import etree
+from lxml.html import HtmlElement
 from tqdm import tqdm
 from urllib.parse import urlparse
 import hashlib
 import os
+import zlib
 
 
 # ───────────────────────────── CLI ────────────────────────────────────────
@@ -38,14 +54,136 @@ def parse_cli(argv: list[str] | None = None) -> argparse.Namespace:
         default="Templates/0611_Masterlist_New_Beta_Nodata.csv",
         help="Column template that defines final header order",
     )
+    p.add_argument(
+        "--jobs",
+        type=int,
+        default=8,
+        help="Parallel page downloads (cache hits never wait)",
+    )
+    p.add_argument(
+        "--delay",
+        type=float,
+        default=0.7,
+        help="Seconds between network requests to the same host",
+    )
+    p.add_argument(
+        "--no_parse_cache",
+        action="store_true",
+        help="Re-parse every page instead of reusing cached parser output",
+    )
+    p.add_argument(
+        "--cache_backend",
+        choices=("files", "sqlite"),
+        default="files",
+        help="Page cache: one file per URL (default) or a single SQLite file",
+    )
+    p.add_argument(
+        "--import_cache",
+        action="store_true",
+        help="Copy Outputs/html_cache/*.html[.gz] into the SQLite cache and exit",
+    )
+    p.add_argument(
+        "--compress_cache",
+        action="store_true",
+        help="Gzip every plain .html page in Outputs/html_cache in place and exit",
+    )
+    p.add_argument(
+        "--cache_ttl",
+        type=float,
+        default=0,
+        help="Days before a cached page is revalidated (0 = keep forever)",
+    )
+    p.add_argument(
+        "--cache_max_mb",
+        type=float,
+        default=0,
+        help="Evict least recently used pages above this size (0 = no limit)",
+    )
+    p.add_argument(
+        "--pool_size",
+        type=int,
+        default=4,
+        help="Keep-alive connections per host",
+    )
+    p.add_argument(
+        "--retries",
+        type=int,
+        default=3,
+        help="Retries with exponential backoff on HTTP 429/5xx",
+    )
+    p.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Download through an asyncio event loop (needs aiohttp); "
+        "--jobs then caps requests in flight",
+    )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes used to parse HTML pages (1 = parse in this process)",
+    )
+    p.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue from the checkpoint next to --out_csv, skipping done rows",
+    )
+    p.add_argument(
+        "--checkpoint_every",
+        type=int,
+        default=100,
+        help="Rows per batch (at least 2%% of the input); checkpointed after each "
+        "(0 = off)",
+    )
+    p.add_argument(
+        "--chunksize",
+        type=int,
+        default=0,
+        help="Stream the input in blocks of N rows to bound memory on big lists "
+        "(0 = load it whole; no --resume/--incremental)",
+    )
+    p.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Copy through rows whose input and cached pages are unchanged",
+    )
+    p.add_argument(
+        "--memo_stats",
+        action="store_true",
+        help="Print hit rates of the memoized text helpers after the run",
+    )
+    p.add_argument(
+        "--stats_json",
+        help="Also write the stage timings and counters to this JSON file",
+    )
+    p.add_argument(
+        "--offline",
+        action="store_true",
+        help="Serve pages from the HTML cache only and report every cache miss",
+    )
+    p.add_argument(
+        "--miss_report",
+        help="CSV for --offline misses (default <out_csv stem>_cache_misses.csv)",
+    )
+    p.add_argument(
+        "--prefetch",
+        nargs="?",
+        const="",
+        metavar="CSV",
+        help="Download every uncached link in CSV (default --in_csv), then exit",
+    )
+    p.add_argument(
+        "--base_url_override",
+        action="append",
+        metavar="[HOST=]BASE",
+        help="Send HTTP requests to BASE/<host>/<path> (e.g. Tools/replay_server.py)",
+    )
     # optional helper: diff two CSVs
     p.add_argument("--diff", nargs=2, metavar=("OLD", "NEW"), help="show CSV diff")
     return p.parse_args(argv)
 
 
-ARGS = parse_cli()
-
-
 # ─────────────── repo / bundle path helpers (+ icon finder) ───────────────
 def repo_dir() -> Path:
     """Return project root for both source and bundled executables."""
@@ -108,6 +246,340 @@ def _cache_name(url: str) -> Path:
     return CACHE_DIR / f"{slug}_{h}.html"
 
 
+def _url_key(url: str) -> str:
+    """Return the 12-char sha1 that also ends every cache filename."""
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()[:12]
+
+
+def _pack(text: str) -> bytes:
+    """Compress a page body for storage."""
+    return zlib.compress(text.encode("utf-8"), 9)
+
+
+def _unpack(blob: bytes) -> str:
+    """Inverse of _pack()."""
+    return zlib.decompress(blob).decode("utf-8", errors="ignore")
+
+
+def _read_page(f: Path) -> str:
+    """Read a cache file, gunzipping '.html.gz' bodies transparently."""
+    if f.suffix == ".gz":
+        return gzip.decompress(f.read_bytes()).decode("utf-8", errors="ignore")
+    return f.read_text(encoding="utf-8", errors="ignore")
+
+
+@dataclass
+class CacheEntry:
+    """A cached page plus the validators needed to revalidate it."""
+
+    body: str
+    fetched_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class FileCache:
+    """
+    Page cache with one '<slug>_<sha1>.html.gz' file per URL (default).
+
+    Plain '.html' files from older runs are still read; compress_all()
+    converts them in place. Fetch time, ETag/Last-Modified and last access
+    live in '_index.json' next to the pages (file mtime when absent).
+    """
+
+    def __init__(self, compress: bool = True, folder: Path = CACHE_DIR) -> None:
+        self.compress = compress
+        self.folder = folder
+        self.index_path = folder / "_index.json"
+        self._lock = threading.Lock()  # * shared by the fetch worker threads
+        self.dirty = False
+        try:
+            self.index: dict[str, dict] = json.loads(
+                self.index_path.read_text(encoding="utf-8")
+            )
+        except Exception:
+            self.index = {}
+
+    def _files(self, url: str) -> tuple[Path, Path]:
+        """Return the (gzipped, plain) paths a URL may be stored under."""
+        plain = self.folder / _cache_name(url).name
+        return plain.with_name(plain.name + ".gz"), plain
+
+    def lookup(self, url: str) -> CacheEntry | None:
+        """Return the cached entry or None."""
+        for cache_file in self._files(url):
+            if not cache_file.exists():
+                continue
+            try:
+                body = _read_page(cache_file)
+            except Exception:
+                continue  # corrupted file? treat as a miss
+            with self._lock:
+                meta = self.index.setdefault(_url_key(url), {})
+                meta["accessed"] = time.time()
+                self.dirty = True
+            return CacheEntry(
+                body,
+                meta.get("fetched", cache_file.stat().st_mtime),
+                meta.get("etag"),
+                meta.get("last_modified"),
+            )
+        return None
+
+    def stamp(self, url: str) -> float | None:
+        """Return when the page was fetched (None if not cached); no body read."""
+        for cache_file in self._files(url):
+            if cache_file.exists():
+                meta = self.index.get(_url_key(url), {})
+                return meta.get("fetched", cache_file.stat().st_mtime)
+        return None
+
+    def get(self, url: str) -> str | None:
+        """Return the cached body or None."""
+        entry = self.lookup(url)
+        return entry.body if entry else None
+
+    def put(
+        self,
+        url: str,
+        body: str,
+        status: int = 200,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a body (ignore failures silently)."""
+        gz, plain = self._files(url)
+        try:
+            if self.compress:
+                gz.write_bytes(gzip.compress(body.encode("utf-8"), 9))
+                plain.unlink(missing_ok=True)
+            else:
+                plain.write_text(body, encoding="utf-8")
+        except Exception:
+            return
+        now = time.time()
+        with self._lock:
+            self.index[_url_key(url)] = {
+                "url": url,
+                "fetched": now,
+                "accessed": now,
+                "etag": etag,
+                "last_modified": last_modified,
+            }
+            self.dirty = True
+
+    def touch(self, url: str) -> None:
+        """Mark a page as freshly validated (HTTP 304)."""
+        with self._lock:
+            self.index.setdefault(_url_key(url), {})["fetched"] = time.time()
+            self.dirty = True
+
+    def evict(self, max_bytes: int) -> tuple[int, int]:
+        """Delete least recently used pages until under max_bytes."""
+        files = [*self.folder.glob("*.html"), *self.folder.glob("*.html.gz")]
+        sizes = {f: f.stat().st_size for f in files}
+        total = sum(sizes.values())
+        removed = freed = 0
+
+        def last_used(f: Path) -> float:
+            meta = self.index.get(f.name.split(".", 1)[0].rsplit("_", 1)[-1], {})
+            return meta.get("accessed", f.stat().st_mtime)
+
+        for f in sorted(files, key=last_used):
+            if total <= max_bytes:
+                break
+            f.unlink(missing_ok=True)
+            self.index.pop(f.name.split(".", 1)[0].rsplit("_", 1)[-1], None)
+            total -= sizes[f]
+            removed, freed = removed + 1, freed + sizes[f]
+            self.dirty = True
+        return removed, freed
+
+    def save(self) -> None:
+        """Persist the metadata index."""
+        if not self.dirty:
+            return
+        tmp = self.index_path.with_suffix(".tmp")
+        try:
+            with self._lock:
+                tmp.write_text(json.dumps(self.index), encoding="utf-8")
+                self.dirty = False
+            os.replace(tmp, self.index_path)
+        except Exception:
+            pass
+
+    def compress_all(self) -> tuple[int, int, int]:
+        """Gzip every plain page in place -> (files, bytes before, bytes after)."""
+        files = before = after = 0
+        for f in sorted(self.folder.glob("*.html")):
+            raw = f.read_bytes()
+            gz = f.with_name(f.name + ".gz")
+            packed = gzip.compress(raw, 9)
+            gz.write_bytes(packed)
+            if gzip.decompress(gz.read_bytes()) != raw:  # ! never lose a page
+                gz.unlink()
+                continue
+            f.unlink()
+            files, before, after = files + 1, before + len(raw), after + len(packed)
+        return files, before, after
+
+
+class SqliteCache:
+    """
+    Single-file page cache for flash drives and network shares.
+
+    Rows are keyed by the same 12-char URL hash the file cache uses, so the
+    existing html_cache folder can be imported without knowing its URLs.
+    Bodies are zlib-compressed.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS pages (
+            key        TEXT PRIMARY KEY,
+            url        TEXT,
+            fetched_at REAL,
+            status     INTEGER,
+            body       BLOB
+        )
+    """
+    # columns added after the first release -> ALTER TABLE on older files
+    EXTRA_COLS = {"etag": "TEXT", "last_modified": "TEXT", "accessed_at": "REAL"}
+
+    def __init__(self, path: Path = CACHE_DIR.with_suffix(".sqlite")) -> None:
+        self.path = path
+        self._lock = threading.Lock()  # * shared by the fetch worker threads
+        self._accessed: dict[str, float] = {}
+        self.conn = sqlite3.connect(str(path), check_same_thread=False)
+        self.conn.execute(self.SCHEMA)
+        have = {r[1] for r in self.conn.execute("PRAGMA table_info(pages)")}
+        for col, kind in self.EXTRA_COLS.items():
+            if col not in have:
+                self.conn.execute(f"ALTER TABLE pages ADD COLUMN {col} {kind}")
+        self.conn.commit()
+
+    def lookup(self, url: str) -> CacheEntry | None:
+        """Return the cached entry or None."""
+        key = _url_key(url)
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT body, fetched_at, etag, last_modified FROM pages "
+                "WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row:
+                self._accessed[key] = time.time()  # flushed by save()
+        if not row:
+            return None
+        try:
+            return CacheEntry(_unpack(row[0]), row[1] or 0.0, row[2], row[3])
+        except zlib.error:
+            return None  # corrupted row? treat as a miss
+
+    def stamp(self, url: str) -> float | None:
+        """Return when the page was fetched (None if not cached); no body read."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT fetched_at FROM pages WHERE key = ?", (_url_key(url),)
+            ).fetchone()
+        return (row[0] or 0.0) if row else None
+
+    def get(self, url: str) -> str | None:
+        """Return the cached body or None."""
+        entry = self.lookup(url)
+        return entry.body if entry else None
+
+    def put(
+        self,
+        url: str,
+        body: str,
+        status: int = 200,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a body together with its fetch time, status and validators."""
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO pages (key, url, fetched_at, status, body, "
+                "etag, last_modified, accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    _url_key(url),
+                    url,
+                    now,
+                    status,
+                    _pack(body),
+                    etag,
+                    last_modified,
+                    now,
+                ),
+            )
+            self.conn.commit()
+
+    def touch(self, url: str) -> None:
+        """Mark a page as freshly validated (HTTP 304)."""
+        with self._lock:
+            self.conn.execute(
+                "UPDATE pages SET fetched_at = ? WHERE key = ?",
+                (time.time(), _url_key(url)),
+            )
+            self.conn.commit()
+
+    def evict(self, max_bytes: int) -> tuple[int, int]:
+        """Delete least recently used pages until under max_bytes."""
+        self.save()
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT key, length(body) FROM pages "
+                "ORDER BY COALESCE(accessed_at, fetched_at, 0)"
+            ).fetchall()
+            total = sum(size for _, size in rows)
+            doomed, freed = [], 0
+            for key, size in rows:
+                if total <= max_bytes:
+                    break
+                doomed.append(key)
+                total, freed = total - size, freed + size
+            self.conn.executemany(
+                "DELETE FROM pages WHERE key = ?", [(k,) for k in doomed]
+            )
+            self.conn.commit()
+            if doomed:
+                self.conn.execute("VACUUM")
+        return len(doomed), freed
+
+    def save(self) -> None:
+        """Flush last-access times collected by lookup()."""
+        with self._lock:
+            if self._accessed:
+                self.conn.executemany(
+                    "UPDATE pages SET accessed_at = ? WHERE key = ?",
+                    [(t, k) for k, t in self._accessed.items()],
+                )
+                self.conn.commit()
+                self._accessed.clear()
+
+    def import_dir(self, folder: Path = CACHE_DIR) -> int:
+        """One-time import of '<slug>_<sha1>.html[.gz]' files; returns rows added."""
+        added = 0
+        with self._lock:
+            for f in sorted([*folder.glob("*.html"), *folder.glob("*.html.gz")]):
+                key = f.name.split(".", 1)[0].rsplit("_", 1)[-1]
+                body = _read_page(f)
+                cur = self.conn.execute(
+                    "INSERT OR IGNORE INTO pages (key, url, fetched_at, status, body) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, None, f.stat().st_mtime, 200, _pack(body)),
+                )
+                added += cur.rowcount
+            self.conn.commit()
+        return added
+
+
+CACHE: FileCache | SqliteCache = FileCache()
+CACHE_TTL = 0.0  # seconds before a cached page is revalidated (0 = never)
+OFFLINE = False  # serve pages from CACHE only, never the network (--offline)
+
+
 # ───────────────────── CSV diff helper (optional) ─────────────────────────
 def csv_diff(old_csv: Path, new_csv: Path) -> None:
     """Print cell-level differences between two CSV files."""
@@ -131,7 +603,8 @@ def csv_diff(old_csv: Path, new_csv: Path) -> None:
 
 
 # ──────────────────────────── constants ───────────────────────────────────
-SLEEP = 0.7  # delay between HTTP requests
+SLEEP = 0.7  # delay between HTTP requests to the same host
+NORM_CACHE = 4096  # memoized results kept per text helper (see memo_stats)
 
 HEADERS = {
     "User-Agent": (
@@ -207,11 +680,23 @@ def missing(v: str | None, rev: str | None = None) -> bool:
     return not s
 
 
+# precompiled patterns for the memoized text helpers
+_NUM_RE = re.compile(r"[\d.]+")
+_SPLIT_RE = re.compile(r"[|,]")
+_WS_RE = re.compile(r"\s+")
+_TO_RE = re.compile(r"\bto\b")
+_DASH_RE = re.compile(r"\s*-\s*")
+_MONTH_SPLIT_RE = re.compile(r"[\s,/]+")
+_CONNECTOR_RE = re.compile(r"\s*(?:/|\band\b|\bwith\b|&)\s*", re.I)
+_BINOMIAL_RE = re.compile(r"^([A-Za-z×\-]+)\s+([A-Za-z×\-]+)(.*)$")
+
+
+@lru_cache(maxsize=NORM_CACHE)
 def rng(s: str | None) -> str | None:
     """“1–3 ft” -> “1 - 3” (or None), skip invalid floats like '.'"""
     if not s:
         return None
-    nums = re.findall(r"[\d.]+", s)
+    nums = _NUM_RE.findall(s)
     out = []
     for n in nums:
         try:
@@ -235,12 +720,13 @@ def csv_join(parts: list[str]) -> str | None:
     return ", ".join(out) if out else None
 
 
+@lru_cache(maxsize=NORM_CACHE)
 def merge_field(a: str | None, b: str | None) -> str | None:
     """Merge two comma or pipe separated strings uniquely."""
     # // Used for additive fields like Attracts
     parts = [
-        *(re.split(r"[|,]", a) if a else []),
-        *(re.split(r"[|,]", b) if b else []),
+        *(_SPLIT_RE.split(a) if a else []),
+        *(_SPLIT_RE.split(b) if b else []),
     ]
     items = OrderedDict.fromkeys(p.strip() for p in parts if p and p.strip())
     return ", ".join(items.keys()) if items else None
@@ -349,42 +835,425 @@ def gen_key(botanical: str, used: set[str]) -> str:
     return key
 
 
+# ───────────────────── run statistics ─────────────────────────────────────
+class Stats:
+    """Per-stage timings and event counters for one fill run (thread-safe)."""
+
+    # print order; fetch/* stages are summed over the concurrent downloads
+    STAGES = (
+        "read csv",
+        "plan",
+        "download",
+        "fetch/cache read",
+        "fetch/throttle wait",
+        "fetch/network",
+        "fetch/cache write",
+        *(f"parse {tag}" for tag in ("MBG", "WF", "PR", "NM", "PN")),
+        "merge",
+        "checkpoint",
+        "write csv",
+    )
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.seconds: dict[str, float] = {}
+        self.calls: dict[str, int] = {}
+        self.counts: dict[str, int] = {}
+
+    def add(self, stage: str, seconds: float, calls: int = 1) -> None:
+        """Book ``seconds`` spent in ``stage``."""
+        with self._lock:
+            self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+            self.calls[stage] = self.calls.get(stage, 0) + calls
+
+    @contextmanager
+    def timer(self, stage: str):
+        """``with STATS.timer("merge"): ...`` books the block's wall time."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - start)
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Bump an event counter (cache hits, retries, ...)."""
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + n
+
+    def as_dict(self) -> dict:
+        """Everything collected so far, ready for json.dumps()."""
+        order = [s for s in self.STAGES if s in self.seconds]
+        order += sorted(set(self.seconds) - set(order))
+        return {
+            "wall_s": round(time.perf_counter() - self.started, 3),
+            "stages": {
+                s: {"seconds": round(self.seconds[s], 3), "calls": self.calls[s]}
+                for s in order
+            },
+            "counts": dict(sorted(self.counts.items())),
+        }
+
+    def report(self) -> None:
+        """Print the stage table and the counters."""
+        data = self.as_dict()
+        wall = data["wall_s"] or 1e-9
+        print(f"{'stage':<18} {'calls':>7} {'sec':>8} {'avg ms':>8} {'% wall':>7}")
+        for stage, s in data["stages"].items():
+            avg = s["seconds"] / s["calls"] * 1000 if s["calls"] else 0.0
+            print(
+                f"{stage:<18} {s['calls']:>7} {s['seconds']:>8.2f} {avg:>8.1f} "
+                f"{s['seconds'] / wall:>7.0%}"
+            )
+        print(f"{'total (wall)':<18} {'':>7} {data['wall_s']:>8.2f}")
+        for name, n in data["counts"].items():
+            print(f"[stats] {name:<20} {n:>7}")
+
+
+STATS = Stats()
+
+
+# ───────────────────── pooled HTTP client ─────────────────────────────────
+# * Same block lives in GetLinks.py (each script ships as its own EXE); keep
+# * the two in step. Differences: only this copy has the STATS.* calls
+POOL_SIZE = 4  # keep-alive connections kept open per host
+RETRIES = 3  # extra attempts after a 429 / 5xx answer
+BACKOFF = 1.0  # first backoff step in seconds (doubles every retry)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+URL_OVERRIDES: dict[str, str] = {}  # host ("*" = every host) -> replay base URL
+
+_SESSIONS: dict[str, requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def session_for(url: str) -> requests.Session:
+    """Return the keep-alive session for the URL's host (one per host)."""
+    host = urlparse(url).netloc.lower()
+    with _SESSIONS_LOCK:
+        if host not in _SESSIONS:
+            sess = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+            sess.mount("https://", adapter)
+            sess.mount("http://", adapter)
+            _SESSIONS[host] = sess
+        return _SESSIONS[host]
+
+
+def _backoff(attempt: int, retry_after: str | None) -> float:
+    """Exponential backoff with jitter, never shorter than Retry-After."""
+    delay = BACKOFF * 2**attempt + random.uniform(0, BACKOFF)
+    if retry_after and retry_after.strip().isdigit():
+        delay = max(delay, float(retry_after))
+    return delay
+
+
+def set_url_overrides(specs: list[str] | None) -> None:
+    """Load --base_url_override values, each BASE or HOST=BASE."""
+    for spec in specs or []:
+        host, _, base = spec.rpartition("=")
+        URL_OVERRIDES[host.lower() or "*"] = base.rstrip("/")
+
+
+def override_url(url: str) -> str:
+    """Map a site URL onto its replay server as BASE/<host>/<path>?<query>."""
+    if not URL_OVERRIDES:
+        return url
+    p = urlparse(url)
+    host = p.netloc.lower()
+    base = next(
+        (b for h, b in URL_OVERRIDES.items() if host == h or host.endswith("." + h)),
+        URL_OVERRIDES.get("*"),
+    )
+    if not base:
+        return url
+    return f"{base}/{p.netloc}{p.path or '/'}" + (f"?{p.query}" if p.query else "")
+
+
+def http_get(
+    url: str,
+    headers: dict[str, str] | None = None,
+    timeout: float = 12,
+    retries: int | None = None,
+    stream: bool = False,
+) -> requests.Response:
+    """
+    GET through the pooled session for the host.
+
+    403 -> retry once with HEADERS_ALT; 429/5xx -> back off and retry.
+    Network errors propagate to the caller like plain requests.get().
+    The request goes to override_url(url); callers keep the real URL.
+    With stream=True the body is left unread (the caller closes it).
+    """
+    extra = headers or {}
+    sess = session_for(url)
+    target = override_url(url)
+    retries = RETRIES if retries is None else retries
+    kw = {"timeout": timeout, "stream": stream}
+    for attempt in range(retries + 1):
+        r = sess.get(target, headers=HEADERS | extra, **kw)
+        if r.status_code == 403:
+            STATS.count("403 fallbacks")
+            r.close()
+            r = sess.get(target, headers=HEADERS_ALT | extra, **kw)
+        if r.status_code not in RETRY_STATUS or attempt == retries:
+            break
+        STATS.count("retries")
+        r.close()
+        time.sleep(_backoff(attempt, r.headers.get("Retry-After")))
+    return r
+
+
 # ───────────────────── HTTP fetch helper ──────────────────────────────────
+# * Same class as in GetLinks.py; here delay defaults to SLEEP, only this copy
+# * records STATS, and per_host stays empty (no --host_delay flag)
+class HostThrottle:
+    """Space out network hits per host instead of one global sleep."""
+
+    def __init__(self, delay: float = SLEEP, per_host: dict | None = None) -> None:
+        self.delay = delay
+        self.per_host: dict[str, float] = per_host or {}  # domain -> seconds
+        self._lock = threading.Lock()
+        self._next: dict[str, float] = {}
+
+    def delay_for(self, host: str) -> float:
+        """Politeness gap for a host: the most specific per-domain entry wins."""
+        # ? override this to plug in another policy (robots.txt, time of day...)
+        for dom in sorted(self.per_host, key=len, reverse=True):
+            if host == dom or host.endswith("." + dom):
+                return self.per_host[dom]
+        return self.delay
+
+    def reserve(self, url: str) -> float:
+        """Book the next slot for the URL's host -> seconds to wait for it."""
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next.get(host, 0.0))
+            self._next[host] = slot + self.delay_for(host)
+        return slot - now
+
+    def wait(self, url: str) -> None:
+        """Block until the host of ``url`` may be contacted again."""
+        # * Reserve the next slot under the lock, sleep outside of it
+        if (pause := self.reserve(url)) > 0:
+            time.sleep(pause)
+            STATS.add("fetch/throttle wait", pause)
+
+
+THROTTLE = HostThrottle()
+
+
 # ------------------------------------------------------------------------
 #  Cached fetch()
 # ------------------------------------------------------------------------
+def _is_fresh(entry: CacheEntry | None) -> bool:
+    """True when a cached entry can be served without asking the server."""
+    return bool(entry) and (not CACHE_TTL or time.time() - entry.fetched_at < CACHE_TTL)
+
+
+def _validators(entry: CacheEntry | None) -> dict[str, str]:
+    """Conditional-request headers for a stale cache entry."""
+    cond: dict[str, str] = {}
+    if entry and entry.etag:
+        cond["If-None-Match"] = entry.etag
+    if entry and entry.last_modified:
+        cond["If-Modified-Since"] = entry.last_modified
+    return cond
+
+
+def _decode_body(body: bytes, headers) -> str:
+    """Response bytes -> text by requests' rules, so both fetch paths agree."""
+    # * header charset, else ISO-8859-1 for text/*, else a guess (= r.text)
+    enc = requests.utils.get_encoding_from_headers(headers)
+    enc = enc or requests.compat.chardet.detect(body)["encoding"] or "utf-8"
+    try:
+        return body.decode(enc, errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+def _settle(
+    url: str, entry: CacheEntry | None, status: int, text: str, headers
+) -> str | None:
+    """Common tail of fetch()/the async fetcher: 304 reuse, store 2xx/3xx."""
+    if status == 304 and entry:
+        STATS.count("not modified (304)")
+        CACHE.touch(url)
+        return entry.body
+    if status < 400:
+        STATS.count("downloaded")
+        # save a copy for next time (ignore failures silently)
+        with STATS.timer("fetch/cache write"):
+            CACHE.put(
+                url,
+                text,
+                status,
+                etag=headers.get("ETag"),
+                last_modified=headers.get("Last-Modified"),
+            )
+        return text
+    STATS.count("http errors")
+    return entry.body if entry else None
+
+
+def _cache_lookup(url: str) -> CacheEntry | None:
+    """CACHE.lookup() that books the read time and the hit/miss counters."""
+    with STATS.timer("fetch/cache read"):
+        entry = CACHE.lookup(url)
+    if not entry:
+        STATS.count("cache misses")
+    elif _is_fresh(entry) or OFFLINE:
+        STATS.count("cache hits")
+    else:
+        STATS.count("cache stale")
+    return entry
+
+
 def fetch(url: str) -> str | None:
     """
-    1. Look for <CACHE_DIR>/<slug>.html → return its contents if found.
-    2. Otherwise hit the network, save a copy to the cache, and return it.
-    If the request fails, return None (previous behaviour).
+    1. Look the URL up in CACHE (html_cache folder or SQLite file).
+    2. Fresh hit -> return it; stale hit (older than CACHE_TTL) -> send a
+       conditional request and reuse the cached body on 304.
+    3. Otherwise hit the network, save a copy to the cache, and return it.
+    If the request fails, return the stale copy or None (previous behaviour).
+    With OFFLINE set, step 1 is all there is: stale copies are served as-is.
     """
-    cache_file = _cache_name(url)
     # // Simple offline cache to reduce server hits
 
     # ---------- 1. serve from cache if we already have it ---------------
-    if cache_file.exists():
-        try:
-            return cache_file.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
-            pass  # corrupted file? fall back to network
+    entry = _cache_lookup(url)
+    if _is_fresh(entry) or OFFLINE:
+        return entry.body if entry else None
 
-    # ---------- 2. otherwise, fetch & store -----------------------------
+    # ---------- 2. otherwise, (re)validate & store ----------------------
+    THROTTLE.wait(url)  # * politeness delay only applies to real network hits
     try:
-        r = requests.get(url, headers=HEADERS, timeout=12)
-        if r.status_code == 403:
-            r = requests.get(url, headers=HEADERS_ALT, timeout=12)
-        if r.ok:
-            # save a copy for next time (ignore failures silently)
-            try:
-                cache_file.write_text(r.text, encoding="utf-8")
-            except Exception:
-                pass
-            return r.text
+        with STATS.timer("fetch/network"):
+            r = http_get(url, headers=_validators(entry))
+            text = _decode_body(r.content, r.headers)
     except requests.RequestException:
-        pass
+        STATS.count("network errors")
+        return entry.body if entry else None
+    return _settle(url, entry, r.status_code, text, r.headers)
+
+
+def fetch_many(urls: list[str], jobs: int = 8) -> dict[str, str | None]:
+    """Fetch ``urls`` with a bounded worker pool -> {url: html or None}."""
+    # // Different hosts download in parallel; THROTTLE keeps each host polite
+    pages: dict[str, str | None] = {}
+    if not urls:
+        return pages
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        futures = {pool.submit(fetch, u): u for u in urls}
+        for fut in tqdm(as_completed(futures), total=len(futures), desc="Fetch"):
+            pages[futures[fut]] = fut.result()
+    return pages
+
+
+async def _fetch_async(session, url: str, host_sem, aiohttp) -> str | None:
+    """Event-loop twin of fetch(): same cache, throttle, 403 and backoff rules."""
+    entry = _cache_lookup(url)
+    if _is_fresh(entry) or OFFLINE:
+        return entry.body if entry else None
+    cond = _validators(entry)
+    async with host_sem:
+        if (pause := THROTTLE.reserve(url)) > 0:
+            await asyncio.sleep(pause)
+            STATS.add("fetch/throttle wait", pause)
+        try:
+            for attempt in range(RETRIES + 1):
+                for hdrs in (HEADERS, HEADERS_ALT):
+                    target = override_url(url)
+                    with STATS.timer("fetch/network"):
+                        async with session.get(target, headers=hdrs | cond) as resp:
+                            status, headers = resp.status, resp.headers
+                            text = _decode_body(await resp.read(), headers)
+                    if status != 403 or hdrs is HEADERS_ALT:
+                        break
+                    STATS.count("403 fallbacks")
+                if status not in RETRY_STATUS or attempt == RETRIES:
+                    break
+                STATS.count("retries")
+                await asyncio.sleep(_backoff(attempt, headers.get("Retry-After")))
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            STATS.count("network errors")
+            return entry.body if entry else None
+    return _settle(url, entry, status, text, headers)
 
-    return None
+
+async def _fetch_all_async(urls: list[str], jobs: int) -> dict[str, str | None]:
+    """Run every download on one event loop with a semaphore per host."""
+    try:
+        import aiohttp  # optional: only needed for --async
+    except ImportError:
+        raise SystemExit("[ERROR] --async needs aiohttp:  pip install aiohttp")
+
+    host_sems: dict[str, asyncio.Semaphore] = {}
+    connector = aiohttp.TCPConnector(limit=max(1, jobs), limit_per_host=POOL_SIZE)
+    timeout = aiohttp.ClientTimeout(total=12 * (RETRIES + 1), sock_read=12)
+    pages: dict[str, str | None] = {}
+    async with aiohttp.ClientSession(
+        connector=connector,
+        timeout=timeout,
+        trust_env=True,  # honour *_PROXY like requests
+    ) as sess:
+
+        async def one(url: str) -> tuple[str, str | None]:
+            host = urlparse(url).netloc.lower()
+            sem = host_sems.setdefault(host, asyncio.Semaphore(POOL_SIZE))
+            return url, await _fetch_async(sess, url, sem, aiohttp)
+
+        tasks = [one(u) for u in urls]
+        for fut in tqdm(asyncio.as_completed(tasks), total=len(tasks), desc="Fetch"):
+            url, html = await fut
+            pages[url] = html
+    return pages
+
+
+def fetch_many_async(urls: list[str], jobs: int = 8) -> dict[str, str | None]:
+    """asyncio counterpart of fetch_many() -> {url: html or None}."""
+    if not urls:
+        return {}
+    return asyncio.run(_fetch_all_async(urls, jobs))
+
+
+# ───────────────────── cache prefetch ─────────────────────────────────────
+# every column that can hold page links (URL = a --offline miss report)
+LINK_COLS = [
+    "Link: Missouri Botanical Garden",
+    "Link: Wildflower.org",
+    "Link: Pleasantrunnursery.com",
+    "Link: Newmoonnursery.com",
+    "Link: Pinelandsnursery.com",
+    "Link: Others",
+    "URL",
+]
+_URL_RE = re.compile(r"https?://[^\s\"\];]+")  # also splits [TAG,"URL","Label"]
+
+
+def collect_urls(csv_path: Path) -> list[str]:
+    """Return every distinct http(s) URL found in the CSV's link columns."""
+    df = pd.read_csv(csv_path, dtype=str, keep_default_na=False)
+    urls: list[str] = []
+    for col in LINK_COLS:
+        if col in df.columns:
+            for cell in df[col]:
+                urls += _URL_RE.findall(cell)
+    return list(dict.fromkeys(urls))
+
+
+def prefetch(csv_path: Path, jobs: int = 8, use_async: bool = False) -> tuple:
+    """Download the CSV's pages that are not cached yet -> (found, todo, ok)."""
+    # * Warm the cache on a good connection, then fill with --offline
+    urls = collect_urls(csv_path)
+    now = time.time()
+    todo = [
+        u
+        for u in urls
+        if (t := CACHE.stamp(u)) is None or (CACHE_TTL and now - t >= CACHE_TTL)
+    ]
+    pages = (fetch_many_async if use_async else fetch_many)(todo, jobs)
+    return len(urls), len(todo), sum(1 for u in todo if pages.get(u))
 
 
 # ───────────────────────────── parsers ────────────────────────────────────
@@ -398,36 +1267,145 @@ def _grab(text: str, label: str) -> str:
     return m.group(1).strip() if m else ""
 
 
+# --- lxml DOM helpers ----------------------------------------------------
+# * Each page is parsed once with lxml; the helpers read the tree the way
+# * BeautifulSoup did, so parser output is unchanged (see Tools/bench_parsers.py)
+_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+_NO_TEXT = ("script", "style", "template", "rt", "rp")
+_TEXT_NODES = etree.XPath(
+    ".//text()[not(ancestor::script or ancestor::style or ancestor::template"
+    " or ancestor::rt or ancestor::rp)]",
+    smart_strings=False,
+)
+
+
+def _dom(html: str) -> HtmlElement:
+    """Build the lxml tree for a page."""
+    try:
+        return lxml.html.document_fromstring(
+            html.encode("utf-8", "replace"), parser=_HTML_PARSER
+        )
+    except etree.ParserError:  # blank page
+        return lxml.html.document_fromstring("<html></html>")
+
+
+def _text(el: HtmlElement, sep: str = "", strip: bool = False) -> str:
+    """Element text like bs4 get_text(): skips comments and script/style."""
+    parts = el.xpath(".//text()") if el.tag in _NO_TEXT else _TEXT_NODES(el)
+    if strip:
+        parts = [s for p in parts if (s := p.strip())]
+    return sep.join(parts)
+
+
+def _string(el: HtmlElement) -> Optional[str]:
+    """Text of an element whose only child is one string (bs4 .string)."""
+    while isinstance(el.tag, str):
+        if len(el) + bool(el.text) + sum(bool(c.tail) for c in el) != 1:
+            return None
+        if el.text:
+            return el.text
+        el = el[0]
+    return el.text  # lone comment
+
+
+def _find_heading(
+    root: HtmlElement, needle: str, tags: tuple[str, ...] = ("h2", "h3", "h4")
+) -> Optional[HtmlElement]:
+    """First heading whose text contains needle (lower-case)."""
+    for h in root.iter(*tags):
+        if needle in _text(h, strip=True).lower():
+            return h
+    return None
+
+
+def _find_string(root: HtmlElement, tag: str, needle: str) -> Optional[HtmlElement]:
+    """First <tag> whose lone string contains needle (lower-case)."""
+    for el in root.iter(tag):
+        if (s := _string(el)) and needle in s.lower():
+            return el
+    return None
+
+
+def _find_next(el: HtmlElement, tag: str) -> Optional[HtmlElement]:
+    """First <tag> after el in document order, own children included."""
+    for hit in el.iterdescendants(tag):
+        return hit
+    hits = el.xpath(f"following::{tag}[1]")
+    return hits[0] if hits else None
+
+
+def _first(el: HtmlElement, *tags: str) -> Optional[HtmlElement]:
+    """First descendant with one of the given tag names."""
+    return next(el.iterdescendants(*tags), None)
+
+
+def _parent(el: HtmlElement, tag: str) -> Optional[HtmlElement]:
+    """Closest ancestor with the given tag name."""
+    return next(el.iterancestors(tag), None)
+
+
+def _siblings(el: HtmlElement) -> list[HtmlElement]:
+    """Following sibling elements (comments skipped)."""
+    return [s for s in el.itersiblings() if isinstance(s.tag, str)]
+
+
+def _next_nodes(el: HtmlElement):
+    """Yield the strings and nodes after el, like bs4 next_siblings."""
+    if el.tail:
+        yield el.tail
+    for sib in el.itersiblings():
+        yield sib
+        if sib.tail:
+            yield sib.tail
+
+
+def _has_class(el: HtmlElement, cls: str) -> bool:
+    """True when cls is one of the element's classes."""
+    return cls in el.get("class", "").split()
+
+
+def _label_value(strong: HtmlElement) -> Optional[str]:
+    """Clean text between a <strong> label and the next <strong>."""
+    val_parts = []
+    for sib in _next_nodes(strong):
+        if isinstance(sib, str):
+            val_parts.append(sib)
+        elif sib.tag == "strong":
+            break
+        elif isinstance(sib.tag, str):
+            val_parts.append(_text(sib, " ", strip=True))
+        else:
+            val_parts.append(sib.text or "")  # comments count as text here
+    return clean(" ".join(val_parts).strip())
+
+
 # Wildflower helpers
-def _section_text(soup: BeautifulSoup, hdr: str) -> str:
+def _section_text(root: HtmlElement, hdr: str) -> str:
     """Concatenate paragraph text that follows a given header."""
-    h = soup.find(
-        lambda t: t.name in ("h2", "h3", "h4")
-        and hdr.lower() in t.get_text(strip=True).lower()
-    )
-    if not h:
+    h = _find_heading(root, hdr.lower())
+    if h is None:
         return ""
     out = []
-    for sib in h.find_next_siblings():
-        if sib.name in ("h2", "h3", "h4"):
+    for sib in _siblings(h):
+        if sib.tag in ("h2", "h3", "h4"):
             break
-        out.append(sib.get_text("\n", strip=True))
+        out.append(_text(sib, "\n", strip=True))
     return "\n".join(out).strip()
 
 
-def _wf_wetland(soup: BeautifulSoup, region: str = "AGCP") -> Optional[str]:
+def _wf_wetland(root: HtmlElement, region: str = "AGCP") -> Optional[str]:
     """Return the wetland indicator status for a region."""
-    h = soup.find("h4", string=lambda x: x and "wetland indicator" in x.lower())
-    if not h:
+    h = _find_string(root, "h4", "wetland indicator")
+    if h is None:
         return None
-    tbl = h.find_next("table")
-    if not tbl:
+    tbl = _find_next(h, "table")
+    if tbl is None:
         return None
-    rows = tbl.find_all("tr")
+    rows = list(tbl.iterdescendants("tr"))
     if len(rows) < 2:
         return None
-    hdrs = [td.get_text(strip=True) for td in rows[0].find_all("td")]
-    vals = [td.get_text(strip=True) for td in rows[1].find_all("td")]
+    hdrs = [_text(td, strip=True) for td in rows[0].iterdescendants("td")]
+    vals = [_text(td, strip=True) for td in rows[1].iterdescendants("td")]
     if hdrs and hdrs[0].lower().startswith("region"):
         hdrs = hdrs[1:]
     if vals and vals[0].lower().startswith("status"):
@@ -436,20 +1414,18 @@ def _wf_wetland(soup: BeautifulSoup, region: str = "AGCP") -> Optional[str]:
 
 
 # --- text normalisation helpers ------------------------------------------
+@lru_cache(maxsize=NORM_CACHE)
 def clean(text: str | None) -> str | None:
     """Normalise whitespace/punctuation and map common phrasing."""
     if not text:
         return None
-    text = re.sub(r"\s+", " ", text)  # squeeze spaces/newlines
+    text = _WS_RE.sub(" ", text)  # squeeze spaces/newlines
     text = text.replace(" ,", ",").strip(" ,")
     text = text.strip()
     key = text.lower()
     if key in NORMALISE:
         return NORMALISE[key]
-    for val in NORMALISE.values():
-        if key == val.lower():
-            return val
-    return text
+    return NORMALISE_REVERSE.get(key, text)
 
 
 MONTHS = "Jan Feb Mar Apr May Jun Jul Aug Sep Oct Nov Dec".split()
@@ -465,8 +1441,13 @@ NORMALISE = {
     "medium to wet": "Medium, Wet",
     "wet": "Wet",
 }
+# lower-cased canonical value -> canonical value (first one wins, as before)
+NORMALISE_REVERSE: dict[str, str] = {}
+for _val in NORMALISE.values():
+    NORMALISE_REVERSE.setdefault(_val.lower(), _val)
 
 
+@lru_cache(maxsize=NORM_CACHE)
 def month_list(raw: str | None) -> str | None:
     """
     Convert any 'Apr-May' · 'April to May' · 'Apr through Jun'
@@ -477,9 +1458,9 @@ def month_list(raw: str | None) -> str | None:
     s = raw.title().replace("Through", "to")
     for dash in ("\u2013", "\u2014"):
         s = s.replace(dash, "-")
-    s = re.sub(r"\bto\b", "-", s)
-    s = re.sub(r"\s*-\s*", "-", s)
-    rng = re.split(r"[\s,/]+", s)
+    s = _TO_RE.sub("-", s)
+    s = _DASH_RE.sub("-", s)
+    rng = _MONTH_SPLIT_RE.split(s)
     if "-" in rng[0]:
         rng = [*rng[0].split("-")]
     if len(rng) == 2 and all(m[:3] in MONTHS for m in rng):
@@ -496,12 +1477,13 @@ def month_list(raw: str | None) -> str | None:
     return ", ".join(months)
 
 
+@lru_cache(maxsize=NORM_CACHE)
 def color_list(raw: str | None) -> str | None:
     """Normalise a comma/connector separated list of colors."""
     if not raw:
         return None
     s = clean(raw) or ""
-    s = re.sub(r"\s*(?:/|\band\b|\bwith\b|&)\s*", ",", s, flags=re.I)
+    s = _CONNECTOR_RE.sub(",", s)
     parts = [p.strip().title() for p in s.split(",")]
     out: list[str] = []
     for p in parts:
@@ -513,55 +1495,34 @@ def color_list(raw: str | None) -> str | None:
 def parse_wf(html: str, want_fallback_sun_water=False) -> Dict[str, Optional[str]]:
     """Parse wildflower.org HTML into plant attribute dict."""
     # // Handles multiple layouts on the site
-    soup = BeautifulSoup(html, "lxml")
-    txt = soup.get_text("\n", strip=True)
+    root = _dom(html)
+    txt = _text(root, "\n", strip=True)
+    lis = [(li, _first(li, "strong", "b")) for li in root.iter("li")]
 
     # Plant-characteristics table
     char: dict[str, str] = {}
-    h = soup.find(
-        lambda t: t.name in ("h2", "h3", "h4")
-        and "plant characteristics" in t.get_text(strip=True).lower()
-    )
-    if h and (tbl := h.find_next("table")):
-        for row in tbl.select("tr"):
-            tds = [td.get_text(" ", strip=True) for td in row.select("td")]
+    h = _find_heading(root, "plant characteristics")
+    if h is not None and (tbl := _find_next(h, "table")) is not None:
+        for row in tbl.iterdescendants("tr"):
+            tds = [_text(td, " ", strip=True) for td in row.iterdescendants("td")]
             if len(tds) >= 2:
                 char[tds[0].rstrip(":")] = tds[1]
 
     if not char:
-        bloom = soup.find("h4", string=lambda x: x and "bloom information" in x.lower())
-        if bloom and (box := bloom.find_parent("div")):
-            for strong in box.find_all("strong"):
-                label = strong.get_text(strip=True).rstrip(":")
+        bloom = _find_string(root, "h4", "bloom information")
+        if bloom is not None and (box := _parent(bloom, "div")) is not None:
+            for strong in box.iterdescendants("strong"):
+                label = _text(strong, strip=True).rstrip(":")
                 if label in {"Bloom Color", "Bloom Time"}:
-                    val_parts = []
-                    for sib in strong.next_siblings:
-                        if getattr(sib, "name", None) == "strong":
-                            break
-                        if isinstance(sib, str):
-                            val_parts.append(sib)
-                        else:
-                            val_parts.append(sib.get_text(" ", strip=True))
-                    char[label] = clean(" ".join(val_parts).strip())
+                    char[label] = _label_value(strong)
 
     # also check "Distribution" section for a Native Habitat/Habitat row
-    dist = soup.find(
-        lambda t: t.name in ("h2", "h3", "h4")
-        and "distribution" in t.get_text(strip=True).lower()
-    )
-    if dist and (box := dist.find_parent("div")):
-        for strong in box.find_all("strong"):
-            label = strong.get_text(strip=True).rstrip(":")
+    dist = _find_heading(root, "distribution")
+    if dist is not None and (box := _parent(dist, "div")) is not None:
+        for strong in box.iterdescendants("strong"):
+            label = _text(strong, strip=True).rstrip(":")
             if label in {"Native Habitat", "Habitat"}:
-                val_parts = []
-                for sib in strong.next_siblings:
-                    if getattr(sib, "name", None) == "strong":
-                        break
-                    if isinstance(sib, str):
-                        val_parts.append(sib)
-                    else:
-                        val_parts.append(sib.get_text(" ", strip=True))
-                char[label] = clean(" ".join(val_parts).strip())
+                char[label] = _label_value(strong)
                 break
 
     # Benefits -> UseXYZ
@@ -571,53 +1532,51 @@ def parse_wf(html: str, want_fallback_sun_water=False) -> Dict[str, Optional[str
     ]
     if not uses:
         # Benefit section may use <div> with <strong> labels
-        benefit = soup.find("h4", string=lambda x: x and "benefit" in x.lower())
-        if benefit and (box := benefit.find_parent("div")):
-            sect = box.get_text("\n", strip=True)
+        benefit = _find_string(root, "h4", "benefit")
+        if benefit is not None and (box := _parent(benefit, "div")) is not None:
+            sect = _text(box, "\n", strip=True)
             for m in re.finditer(r"Use\s+([^:]+):\s*(.+?)(?:\n|$)", sect, flags=re.I):
                 uses.append(f"Use {m.group(1).strip()}: {m.group(2).strip()}")
     if not uses:
-        for li in soup.select("li"):
-            strong = li.find(["strong", "b"])
-            if not strong:
+        for li, strong in lis:
+            if strong is None:
                 continue
-            head = strong.get_text(strip=True)
+            head = _text(strong, strip=True)
             if head.lower().startswith("use"):
                 cat = head.replace("Use", "").replace(":", "").strip()
                 body = (
-                    li.get_text(" ", strip=True)
-                    .replace(head, "")
-                    .lstrip(":–—- ")
-                    .strip()
+                    _text(li, " ", strip=True).replace(head, "").lstrip(":–—- ").strip()
                 )
                 uses.append(f"Use {cat}: {body}")
     usexyz = csv_join(uses)
 
     # WFMaintenance
     maint = None
-    for li in soup.select("li"):
-        strong = li.find(["strong", "b"])
-        if strong and "maintenance" in strong.get_text(strip=True).lower():
-            text = li.get_text(" ", strip=True).split(":", 1)[-1].strip()
+    for li, strong in lis:
+        if strong is not None and "maintenance" in _text(strong, strip=True).lower():
+            text = _text(li, " ", strip=True).split(":", 1)[-1].strip()
             maint = f"Maintenance: {text}" if text else None
             break
 
     if not maint:
-        strong = soup.find(
-            lambda t: t.name in ("strong", "b")
-            and "maintenance" in t.get_text(strip=True).lower()
+        strong = next(
+            (
+                t
+                for t in root.iter("strong", "b")
+                if "maintenance" in _text(t, strip=True).lower()
+            ),
+            None,
         )
-        if strong:
+        if strong is not None:
             parts = []
-            for sib in strong.next_siblings:
-                if getattr(sib, "name", None) in {"strong", "b"}:
-                    break
-                if getattr(sib, "name", None) == "br":
+            for sib in _next_nodes(strong):
+                if isinstance(sib, str):
+                    parts.append(sib.strip())
+                    continue
+                if sib.tag in {"strong", "b", "br"}:
                     break
                 parts.append(
-                    sib.get_text(" ", strip=True)
-                    if hasattr(sib, "get_text")
-                    else str(sib)
+                    _text(sib, " ", strip=True) if isinstance(sib.tag, str) else ""
                 )
             text = " ".join(parts).strip()
             maint = f"Maintenance: {text}" if text else None
@@ -628,15 +1587,15 @@ def parse_wf(html: str, want_fallback_sun_water=False) -> Dict[str, Optional[str
         "Bloom Color": color_list(char.get("Bloom Color")),
         "Bloom Time": month_list(char.get("Bloom Time") or char.get("Bloom Period")),
         "Soil Description": clean(
-            _grab(txt, "Soil Description") or _section_text(soup, "Soil Description")
+            _grab(txt, "Soil Description") or _section_text(root, "Soil Description")
         ),
         "Condition Comments": clean(
             _grab(txt, "Condition Comments")
             or _grab(txt, "Conditions Comments")
-            or _section_text(soup, "Comment")
+            or _section_text(root, "Comment")
         ),
         "Native Habitats": clean(char.get("Native Habitat") or char.get("Habitat")),
-        "AGCP Regional Status": _wf_wetland(soup),
+        "AGCP Regional Status": _wf_wetland(root),
         "UseXYZ": usexyz and clean(usexyz),
         "WFMaintenance": clean(maint),
         "Attracts": clean(char.get("Benefit")),
@@ -649,66 +1608,82 @@ def parse_wf(html: str, want_fallback_sun_water=False) -> Dict[str, Optional[str
     return {k: v for k, v in data.items() if v}
 
 
+# MBG key-table labels, matched in one pass (first line after the label).
+# * The lookahead consumes nothing, so a label inside another label's line
+# * still counts, exactly like one search per label would
+MBG_LABELS = (
+    "Height",
+    "Spread",
+    "Sun",
+    "Water",
+    "Tolerate",
+    "Maintenance",
+    "Attracts",
+    "Zone",
+)
+MBG_LABEL_RE = re.compile(
+    rf"(?=({'|'.join(map(re.escape, MBG_LABELS))})\s*[:\-–—]?\s*(.+?)(?:\n|$))",
+    re.I,
+)
+
+
 def parse_mbg(html: str) -> Dict[str, Optional[str]]:
     """Parse the MBG Plant Finder HTML page."""
     # // Extracts height, spread and more from the key table
-    soup = BeautifulSoup(html, "lxml")
+    root = _dom(html)
 
     # helper: return concatenated <p> text that follows an <h3>/<h4> header
     def section(lbl: str) -> str:
-        h = soup.find(
-            lambda t: t.name in ("h3", "h4")
-            and lbl.lower() in t.get_text(strip=True).lower()
-        )
-        if not h:
+        h = _find_heading(root, lbl.lower(), ("h3", "h4"))
+        if h is None:
             return ""
         out = []
-        for sib in h.find_next_siblings():
-            if sib.name in ("h3", "h4"):
+        for sib in _siblings(h):
+            if sib.tag in ("h3", "h4"):
                 break
-            if sib.name == "p":
-                out.append(sib.get_text(" ", strip=True))
+            if sib.tag == "p":
+                out.append(_text(sib, " ", strip=True))
         return clean(" ".join(out))
 
-    # key/value table at top of page
-    plain = soup.get_text("\n", strip=True)
-
-    def grab(label: str) -> str:  # first line only (for numeric stuff)
-        m = re.search(
-            rf"{re.escape(label)}\s*[:\-\u2013\u2014]?\s*(.+?)(?:\n|$)",
-            plain,
-            flags=re.I,
-        )
-        return clean(m.group(1)) if m else ""
+    # key/value table at top of page -> label index built in one pass
+    plain = _text(root, "\n", strip=True)
+    found: dict[str, str] = {}  # lower-case label -> first line after it
+    for m in MBG_LABEL_RE.finditer(plain):
+        found.setdefault(m.group(1).lower(), m.group(2))
+        if len(found) == len(MBG_LABELS):
+            break
+    facts = {
+        lbl: (clean(v) if (v := found.get(lbl.lower())) else "") for lbl in MBG_LABELS
+    }
 
     return {
-        "Height (ft)": rng(grab("Height")),
-        "Spread (ft)": rng(grab("Spread")),
-        "Sun": clean(grab("Sun")),
-        "Water": clean(grab("Water")),
-        "Tolerates": clean(grab("Tolerate")),
-        "MaintenanceLevel": clean(grab("Maintenance")),
-        "Attracts": clean(grab("Attracts")),
+        "Height (ft)": rng(facts["Height"]),
+        "Spread (ft)": rng(facts["Spread"]),
+        "Sun": clean(facts["Sun"]),
+        "Water": clean(facts["Water"]),
+        "Tolerates": clean(facts["Tolerate"]),
+        "MaintenanceLevel": clean(facts["Maintenance"]),
+        "Attracts": clean(facts["Attracts"]),
         "Culture": section("Culture") or section("Growing Tips"),
         "Uses": section("Uses"),
         "Problems": section("Problems"),
-        "Zone": (f"Zone {grab('Zone')}" if grab("Zone") else None),
+        "Zone": (f"Zone {facts['Zone']}" if facts["Zone"] else None),
     }
 
 
 def parse_pr(html: str) -> Dict[str, Optional[str]]:
     """Parse Pleasant Run Nursery HTML."""
     # // Collects Attracts and Tolerates lists
-    soup = BeautifulSoup(html, "lxml")
+    root = _dom(html)
 
     def collect(title: str) -> Optional[str]:
-        h = soup.find("h5", string=lambda x: x and title.lower() in x.lower())
-        if not h:
+        h = _find_string(root, "h5", title.lower())
+        if h is None:
             return None
-        box = h.find_parent("div")
-        if not box:
+        box = _parent(h, "div")
+        if box is None:
             return None
-        vals = [a.get_text(strip=True) for a in box.select("a")]
+        vals = [_text(a, strip=True) for a in box.iterdescendants("a")]
         vals = [re.sub(r"^Attracts\s+", "", v) for v in vals]
         return csv_join(vals)
 
@@ -718,22 +1693,29 @@ def parse_pr(html: str) -> Dict[str, Optional[str]]:
 def parse_nm(html: str) -> Dict[str, Optional[str]]:
     """Parse New Moon Nursery pages."""
     # // Extract sun, water and tolerance details
-    soup = BeautifulSoup(html, "lxml")
+    root = _dom(html)
 
     def next_div_text(title: str) -> Optional[str]:
-        h = soup.find("h4", string=lambda x: x and title.lower() in x.lower())
-        if not h:
+        h = _find_string(root, "h4", title.lower())
+        if h is None:
             return None
-        box = h.find_parent("div")
-        if not box:
+        box = _parent(h, "div")
+        if box is None:
             return None
-        nxt = box.find_next_sibling("div")
-        if not nxt:
+        nxt = next(box.itersiblings("div"), None)
+        if nxt is None:
             return None
-        inner = nxt.find("div", class_="et_pb_text_inner")
-        return inner.get_text(strip=True) if inner else None
+        inner = next(
+            (
+                d
+                for d in nxt.iterdescendants("div")
+                if _has_class(d, "et_pb_text_inner")
+            ),
+            None,
+        )
+        return _text(inner, strip=True) if inner is not None else None
 
-    txt = soup.get_text("\n", strip=True)
+    txt = _text(root, "\n", strip=True)
     flat = txt.replace("\n", " ")
 
     data = {
@@ -759,12 +1741,13 @@ def parse_nm(html: str) -> Dict[str, Optional[str]]:
 def parse_pn(html: str) -> Dict[str, Optional[str]]:
     """Parse Pinelands Nursery HTML search results."""
     # // Falls back to JSON-LD when no direct link exists
-    soup = BeautifulSoup(html, "lxml")
-    info = {
-        i.find("span").get_text(strip=True): i.find("p").get_text(strip=True)
-        for i in soup.select("div.item")
-        if i.find("span") and i.find("p")
-    }
+    info = {}
+    for i in _dom(html).iter("div"):
+        if not _has_class(i, "item"):
+            continue
+        span, p = _first(i, "span"), _first(i, "p")
+        if span is not None and p is not None:
+            info[_text(span, strip=True)] = _text(p, strip=True)
     data = {
         "Bloom Color": color_list(info.get("Bloom Color")),
         "Bloom Time": info.get("Bloom Period"),
@@ -798,6 +1781,7 @@ def gen_key(botanical: str, used: set[str]) -> str:
     return key
 
 
+@lru_cache(maxsize=NORM_CACHE)
 def normalise_botanical(name: str) -> str:
     """Return botanical name as “Genus species 'Cultivar'”."""
     # // Provides consistent formatting for lookups
@@ -805,9 +1789,9 @@ def normalise_botanical(name: str) -> str:
         return name
 
     # squash extra whitespace
-    name = re.sub(r"\s+", " ", name.strip())
+    name = _WS_RE.sub(" ", name.strip())
 
-    m = re.match(r"^([A-Za-z×\-]+)\s+([A-Za-z×\-]+)(.*)$", name)
+    m = _BINOMIAL_RE.match(name)
     if not m:
         return name  # something odd – leave unchanged
 
@@ -828,12 +1812,393 @@ def normalise_botanical(name: str) -> str:
     return " ".join(parts)
 
 
+# text helpers memoized above; memo_stats() reports how often they hit
+MEMOIZED = (clean, month_list, color_list, rng, merge_field, normalise_botanical)
+
+
+def memo_stats() -> dict[str, tuple[int, int, float]]:
+    """Return {helper: (hits, misses, hit rate)} for this process."""
+    out = {}
+    for fn in MEMOIZED:
+        info = fn.cache_info()
+        calls = info.hits + info.misses
+        out[fn.__name__] = (info.hits, info.misses, info.hits / calls if calls else 0.0)
+    return out
+
+
+# ───────────────────── plan → fetch → apply pipeline ──────────────────────
+def _parse_wf_full(html: str) -> Dict[str, Optional[str]]:
+    """parse_wf with Sun/Water fallback; apply_parsed drops them when unwanted."""
+    return parse_wf(html, want_fallback_sun_water=True)
+
+
+# * Bump a source's version whenever its parser output changes; only that
+# * source's entries in the parsed cache go stale.
+PARSER_VERSIONS = {"MBG": 1, "WF": 1, "PR": 1, "NM": 1, "PN": 1}
+PARSED_CACHE = CACHE_DIR / "_parsed.json"
+
+
+class ParsedCache:
+    """Parser output keyed by source, parser version and HTML content hash."""
+
+    def __init__(self, path: Path = PARSED_CACHE, enabled: bool = True) -> None:
+        self.path = path
+        self.enabled = enabled
+        self.data: dict[str, dict] = {}
+        self.dirty = False
+        if enabled and path.exists():
+            try:
+                self.data = json.loads(path.read_text(encoding="utf-8"))
+            except Exception:
+                self.data = {}  # corrupted file? start over
+
+    @staticmethod
+    def key(tag: str, html: str) -> str:
+        """Return '<tag>:v<version>:<sha1 of html>'."""
+        digest = hashlib.sha1(html.encode("utf-8", "ignore")).hexdigest()
+        return f"{tag}:v{PARSER_VERSIONS[tag]}:{digest}"
+
+    def parse(self, tag: str, html: str) -> Dict[str, Optional[str]]:
+        """Return cached parser output, running the parser only on a miss."""
+        k = self.key(tag, html)
+        if k not in self.data:
+            with STATS.timer(f"parse {tag}"):
+                self.data[k] = PARSERS[tag](html)
+            self.dirty = True
+        return dict(self.data[k])
+
+    def prime(self, jobs: list[tuple[str, str]], workers: int = 1) -> None:
+        """Parse every uncached (tag, html) job, fanning out to processes."""
+        # * Results are stored by key, so completion order never matters
+        todo: dict[str, tuple[str, str]] = {}
+        for tag, html in jobs:
+            if (k := self.key(tag, html)) not in self.data:
+                todo[k] = (tag, html)
+        STATS.count("parses reused", len(jobs) - len(todo))
+        if workers <= 1 or len(todo) < 2:
+            for tag, html in todo.values():
+                self.parse(tag, html)
+            return
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(_parse_job, todo.values(), chunksize=4)
+            for (k, (tag, _)), (data, secs) in zip(
+                todo.items(), tqdm(results, total=len(todo), desc="Parse")
+            ):
+                self.data[k] = data
+                STATS.add(f"parse {tag}", secs)  # * CPU time in the worker
+        self.dirty = True
+
+    def save(self) -> None:
+        """Write new entries, dropping those from outdated parser versions."""
+        if not (self.enabled and self.dirty):
+            return
+        current = {f"{t}:v{v}:" for t, v in PARSER_VERSIONS.items()}
+        keep = {k: v for k, v in self.data.items() if k[: k.rindex(":") + 1] in current}
+        tmp = self.path.with_suffix(".tmp")
+        try:
+            tmp.write_text(json.dumps(keep, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, self.path)
+            self.dirty = False
+        except Exception:
+            pass  # cache is an optimisation only
+
+
+def _parse_job(job: tuple[str, str]) -> tuple[Dict[str, Optional[str]], float]:
+    """Process-pool entry point: (source tag, html) -> (parsed dict, seconds)."""
+    tag, html = job
+    start = time.perf_counter()
+    data = PARSERS[tag](html)
+    return data, time.perf_counter() - start
+
+
+# (tag, internal link column, columns the site can fill, parser) in fill order
+SOURCES = (
+    ("MBG", "MBG Link", MBG_COLS, parse_mbg),
+    ("WF", "WF Link", WF_COLS, _parse_wf_full),
+    ("PR", "PR Link", PR_COLS, parse_pr),
+    ("NM", "NM Link", NM_COLS, parse_nm),
+    ("PN", "PN Link", PN_COLS, parse_pn),
+)
+PARSERS = {tag: parser for tag, _, _, parser in SOURCES}
+
+
+def plan_fetches(df: pd.DataFrame) -> dict[tuple[str, str], list]:
+    """Return {(source, url): [row index, …]} for every page a row still needs."""
+    # * Duplicate rows and shared nursery pages collapse onto one entry
+    plan: dict[tuple[str, str], list] = {}
+    for idx, row in df.iterrows():
+        for page in _row_pages(row):
+            plan.setdefault(page, []).append(idx)
+    return plan
+
+
+def _row_pages(row: pd.Series) -> list[tuple[str, str]]:
+    """(source, url) pairs whose page could fill a still-missing cell."""
+    rev = str(row.get("Rev", "")).strip()
+    if not row.get("Botanical Name", "").strip():
+        return []
+    pages = []
+    for tag, link_col, cols, _ in SOURCES:
+        url = row.get(link_col, "").strip()
+        if url.startswith("http") and any(missing(row[c], rev) for c in cols):
+            pages.append((tag, url))
+    return pages
+
+
+def parse_pages(
+    plan: dict[tuple[str, str], list],
+    pages: dict[str, str | None],
+    cache: ParsedCache,
+    workers: int = 1,
+) -> dict[tuple[str, str], Dict[str, Optional[str]]]:
+    """Run each source parser once per page; failed downloads map to {}."""
+    cache.prime([(tag, pages[url]) for tag, url in plan if pages.get(url)], workers)
+    return {
+        (tag, url): cache.parse(tag, html) if (html := pages.get(url)) else {}
+        for tag, url in plan
+    }
+
+
+def _merge_into(col: dict[str, list], i: int, data: dict, rev: str) -> None:
+    """Merge one parsed source dict into row position ``i``."""
+    for k, v in data.items():
+        if k in ADDITIVE_COLS:
+            col[k][i] = merge_additive(k, col[k][i], v)
+        elif missing(col[k][i], rev):
+            col[k][i] = v
+
+
+# columns apply_parsed may change (written back for the batch rows only)
+FILL_COLS = [
+    "Botanical Name",
+    "Key",
+    *sorted(MBG_COLS | WF_COLS | PR_COLS | NM_COLS | PN_COLS),
+]
+
+
+def apply_parsed(
+    df: pd.DataFrame,
+    parsed: dict[tuple[str, str], Dict[str, Optional[str]]],
+    used_keys: set[str],
+    cache: ParsedCache,
+    rows: pd.Index | None = None,
+) -> None:
+    """Merge parsed source data into ``df`` in MBG → WF → PR → NM → PN order."""
+    # * No network here unless a row needs a page the plan did not foresee
+    # * Rows merge on plain lists of this batch only, written back in one block
+    pos = list(range(len(df))) if rows is None else df.index.get_indexer(rows)
+    sub = df.iloc[pos]
+    col = {c: sub[c].tolist() for c in FILL_COLS}
+    for c in {link for _, link, _, _ in SOURCES} | {"Rev"}:
+        col[c] = sub[c].tolist() if c in df.columns else [""] * len(sub)
+
+    done: list[int] = []
+    for i in tqdm(range(len(sub)), desc="Fill"):
+        rev = str(col["Rev"][i]).strip()
+        name = col["Botanical Name"][i]
+        if not name.strip():
+            STATS.count("rows skipped (no name)")
+            continue
+        done.append(i)
+
+        cleaned = col["Botanical Name"][i] = normalise_botanical(name)
+        if not str(col["Key"][i]).strip():
+            col["Key"][i] = gen_key(cleaned, used_keys)
+
+        for tag, link_col, cols, _ in SOURCES:
+            if not any(missing(col[c][i], rev) for c in cols):
+                continue
+            url = str(col[link_col][i]).strip()
+            if not url.startswith("http"):
+                continue
+            if (tag, url) in parsed:
+                data = parsed[tag, url]
+            elif html := fetch(url):
+                # ? a merge blanked a column the plan saw as filled
+                data = parsed[tag, url] = cache.parse(tag, html)
+            else:
+                continue
+            if tag == "WF" and not missing(col["Sun"][i], rev):
+                data = {k: v for k, v in data.items() if k not in ("Sun", "Water")}
+            _merge_into(col, i, data, rev)
+
+    # Clean + additive recheck, one column at a time
+    for c in ("Sun", "Water", "Tolerates", "Soil Description"):
+        vals = col[c]
+        for i in done:
+            vals[i] = clean(vals[i])
+    for c in ("Bloom Time", "Bloom Color"):
+        vals = col[c]
+        for i in done:
+            vals[i] = merge_additive(c, vals[i], None)
+
+    for c in FILL_COLS:
+        if df[c].dtype != object:
+            df[c] = df[c].astype(object)  # * once per run; later batches skip
+    locs = [df.columns.get_loc(c) for c in FILL_COLS]
+    df.iloc[pos, locs] = pd.DataFrame(
+        {c: col[c] for c in FILL_COLS}, dtype=object
+    ).to_numpy()
+
+
+def cache_misses(
+    df: pd.DataFrame, plan: dict[tuple[str, str], list], pages: dict
+) -> list[dict[str, str]]:
+    """One report line per row whose planned page was not in the cache."""
+    cols_for = {tag: cols for tag, _, cols, _ in SOURCES}
+    out = []
+    for (tag, url), idxs in plan.items():
+        if pages.get(url):
+            continue
+        for idx in idxs:
+            rev = str(df.at[idx, "Rev"] if "Rev" in df.columns else "").strip()
+            need = [c for c in sorted(cols_for[tag]) if missing(df.at[idx, c], rev)]
+            out.append(
+                {
+                    "URL": url,
+                    "Source": tag,
+                    "Botanical Name": df.at[idx, "Botanical Name"],
+                    "Needed Columns": ", ".join(need),
+                }
+            )
+    return out
+
+
+# ───────────────────────── checkpoint / resume ────────────────────────────
+class Checkpoint:
+    """Finished batches appended next to the output, replayed on --resume."""
+
+    def __init__(self, out_csv: Path, in_csv: Path, enabled: bool = True) -> None:
+        self.path = out_csv.with_name(f"{out_csv.stem}.checkpoint.pkl")
+        self.source = hashlib.sha1(in_csv.read_bytes()).hexdigest()
+        self.enabled = enabled
+        self.started = False
+
+    def load(self, df: pd.DataFrame) -> int | None:
+        """Copy saved batches into ``df`` and return the rows done, if it fits."""
+        if not self.path.exists():
+            print("[!] no checkpoint to resume from - starting fresh")
+            return None
+        with self.path.open("rb+") as fh:
+            try:
+                head = pickle.load(fh)
+            except Exception as e:
+                print(f"[!] unreadable checkpoint ({e}) - starting fresh")
+                return None
+            if head.get("source") != self.source:
+                print("[!] checkpoint is for a different input CSV - starting fresh")
+                return None
+            done, good = 0, fh.tell()
+            while True:
+                try:
+                    done, rows = pickle.load(fh)
+                except Exception:
+                    break  # * end of file, or a batch cut short by the crash
+                df.loc[rows.index, rows.columns] = rows
+                good = fh.tell()
+            fh.truncate(good)  # ! later batches must not follow a torn one
+        self.started = True
+        return done
+
+    def save(self, rows: pd.DataFrame, done: int) -> None:
+        """Append one finished batch; the first ``done`` rows are then complete."""
+        if not self.enabled:
+            return
+        try:
+            # * a run that did not resume starts a new file with its source hash
+            with self.path.open("ab" if self.started else "wb") as fh:
+                if not self.started:
+                    pickle.dump({"source": self.source}, fh)
+                pickle.dump((done, rows), fh)
+                fh.flush()
+            self.started = True
+        except OSError as e:
+            print(f"[!] could not write checkpoint: {e}")
+
+    def clear(self) -> None:
+        """Drop the checkpoint once the output CSV is written."""
+        self.path.unlink(missing_ok=True)
+
+
+# ───────────────────────── incremental manifest ───────────────────────────
+class Manifest:
+    """Filled rows from the last run, keyed by a hash of each input row."""
+
+    def __init__(self, out_csv: Path, enabled: bool = True) -> None:
+        self.path = out_csv.with_name(f"{out_csv.stem}.manifest.json")
+        self.enabled = enabled
+        self.rows: dict[str, list[dict]] = {}
+        self.hashes: dict = {}
+        self.urls: dict = {}
+        if enabled and self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except Exception:
+                data = {}
+            # // a parser change invalidates every saved row
+            if data.get("parsers") == PARSER_VERSIONS:
+                self.rows = data.get("rows", {})
+
+    @staticmethod
+    def row_hash(row: pd.Series) -> str:
+        """Hash every input cell: name, links, Rev and already filled fields."""
+        blob = json.dumps(list(row.items()), ensure_ascii=False)
+        return hashlib.sha1(blob.encode("utf-8")).hexdigest()
+
+    def match(self, df: pd.DataFrame) -> dict:
+        """Return {row index: saved values} for rows that can be copied through."""
+        if not self.enabled:
+            return {}
+        seen: dict[str, int] = {}
+        reuse = {}
+        for idx, row in df.iterrows():
+            h = self.hashes[idx] = self.row_hash(row)
+            self.urls[idx] = [url for _, url in _row_pages(row)]
+            n = seen[h] = seen.get(h, -1) + 1  # nth duplicate of this row
+            saved = self.rows.get(h, [])
+            if n < len(saved) and self._unchanged(saved[n]["pages"]):
+                reuse[idx] = saved[n]["row"]
+        return reuse
+
+    @staticmethod
+    def _unchanged(pages: dict[str, float | None]) -> bool:
+        """True when every page a row used is cached, fresh and not refetched."""
+        for url, fetched in pages.items():
+            if fetched is None or CACHE.stamp(url) != fetched:
+                return False
+            if CACHE_TTL and time.time() - fetched >= CACHE_TTL:
+                return False
+        return True
+
+    def save(self, df: pd.DataFrame) -> None:
+        """Record every row's filled values and the cache stamps of its pages."""
+        if not self.enabled:
+            return
+        rows: dict[str, list[dict]] = {}
+        for idx, h in self.hashes.items():
+            pages = {url: CACHE.stamp(url) for url in self.urls[idx]}
+            rows.setdefault(h, []).append(
+                {"pages": pages, "row": df.loc[idx].to_dict()}
+            )
+        tmp = self.path.with_suffix(".tmp")
+        try:
+            tmp.write_text(
+                json.dumps({"parsers": PARSER_VERSIONS, "rows": rows}), encoding="utf-8"
+            )
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"[!] could not write manifest: {e}")
+
+
 # ──────────────────────────── main routine ────────────────────────────────
-def fill_csv(in_csv: Path, out_csv: Path, master_csv: Path) -> None:
-    """Fill missing plant data using various website scrapers."""
-    # * Core driver for the enrichment process
-    df = pd.read_csv(in_csv, dtype=str, keep_default_na=False).fillna("")
+def _load_input(in_csv: Path) -> pd.DataFrame:
+    """Read the input CSV with internal link names and every fill column."""
+    return _prepare(pd.read_csv(in_csv, dtype=str, keep_default_na=False))
 
+
+def _prepare(df: pd.DataFrame) -> pd.DataFrame:
+    """Rename link columns to their internal names and add every fill column."""
+    df = df.fillna("")
     df.rename(
         columns={
             "Link: Missouri Botanical Garden": "MBG Link",
@@ -852,95 +2217,85 @@ def fill_csv(in_csv: Path, out_csv: Path, master_csv: Path) -> None:
 
     if "Key" not in df.columns:
         df["Key"] = ""
+    return df
+
+
+def fill_csv(
+    in_csv: Path,
+    out_csv: Path,
+    master_csv: Path,
+    jobs: int = 8,
+    parse_cache: bool = True,
+    use_async: bool = False,
+    workers: int = 1,
+    resume: bool = False,
+    checkpoint_every: int = 100,
+    incremental: bool = False,
+    miss_report: Path | None = None,
+) -> None:
+    """Fill missing plant data using various website scrapers."""
+    # * Core driver for the enrichment process
+    ckpt = Checkpoint(out_csv, in_csv, enabled=checkpoint_every > 0)
+    manifest = Manifest(out_csv, enabled=incremental)
+    with STATS.timer("read csv"):
+        src = _load_input(in_csv)
+    STATS.count("rows", len(src))
+    reuse = manifest.match(src)
+    if reuse:
+        STATS.count("rows reused (incremental)", len(reuse))
+        print(f"[OK] incremental: {len(reuse)} of {len(src)} rows unchanged")
+
+    df, done = src, 0
+    for idx, saved in reuse.items():
+        for col, v in saved.items():
+            df.at[idx, col] = v
+    if resume and (done := ckpt.load(df) or 0):
+        print(f"[OK] resuming after {done} of {len(df)} rows")
     used_keys: set[str] = set(df["Key"].dropna().astype(str))
 
-    for idx, _ in tqdm(df.iterrows(), total=len(df), desc="Fill"):
-        row = df.loc[idx]
-        rev = str(row.get("Rev", "")).strip()
+    # * Rows go through plan → fetch → parse → apply in batches; each finished
+    # * batch is checkpointed so a crash only costs the batch in flight
+    downloader = fetch_many_async if use_async and not OFFLINE else fetch_many
+    misses: list[dict[str, str]] = []
+    cache = ParsedCache(enabled=parse_cache)
+    # * big lists use bigger batches so the download pool rarely drains
+    batch = max(checkpoint_every, len(df) // 50) if checkpoint_every > 0 else len(df)
+    batch = max(batch, 1)
+    for start in range(done, len(df), batch):
+        rows = df.index[start : start + batch]
+        rows = rows[~rows.isin(list(reuse))]
+        with STATS.timer("plan"):
+            plan = plan_fetches(df.loc[rows])
+        with STATS.timer("download"):
+            pages = downloader(list(dict.fromkeys(url for _, url in plan)), jobs)
+        if miss_report:
+            misses += cache_misses(df, plan, pages)
+        parsed = parse_pages(plan, pages, cache, workers)
+        with STATS.timer("merge"):
+            apply_parsed(df, parsed, used_keys, cache, rows)
+        with STATS.timer("checkpoint"):
+            cache.save()
+            ckpt.save(df.loc[rows, FILL_COLS], min(start + batch, len(df)))
+    manifest.save(df)
 
-        if not row.get("Botanical Name", "").strip():
-            continue
+    template_cols = list(
+        pd.read_csv(master_csv, nrows=0, keep_default_na=False).columns
+    )
+    df = _finalise(df, template_cols)
+
+    out_csv.parent.mkdir(parents=True, exist_ok=True)
+    # // Ensure uniform quoting across all columns
+    with STATS.timer("write csv"):
+        df.to_csv(out_csv, index=False, quoting=csv.QUOTE_ALL, na_rep="")
+    ckpt.clear()
+    _saved(out_csv)
+    if miss_report:
+        _write_misses(misses, miss_report)
+        print(f"[OK] {len(misses)} cache misses -> {miss_report}")
 
-        cleaned = normalise_botanical(row["Botanical Name"])
-        if cleaned != row["Botanical Name"]:
-            df.at[idx, "Botanical Name"] = cleaned
-            row["Botanical Name"] = cleaned
-
-        if not str(row.get("Key", "")).strip():
-            df.at[idx, "Key"] = gen_key(cleaned, used_keys)
-
-        # ───────── MBG
-        if any(missing(row[c], rev) for c in MBG_COLS):
-            url = row.get("MBG Link", "").strip()
-            if url.startswith("http") and (html := fetch(url)):
-                for k, v in parse_mbg(html).items():
-                    if k in ADDITIVE_COLS:
-                        df.at[idx, k] = merge_additive(k, df.at[idx, k], v)
-                    elif missing(df.at[idx, k], rev):
-                        df.at[idx, k] = v
-                time.sleep(SLEEP)
-
-        # ───────── WF
-        row = df.loc[idx]
-        if any(missing(row[c], rev) for c in WF_COLS):
-            url = row.get("WF Link", "").strip()
-            if url.startswith("http") and (html := fetch(url)):
-                data = parse_wf(html, want_fallback_sun_water=missing(row["Sun"], rev))
-                for k, v in data.items():
-                    if k in ADDITIVE_COLS:
-                        df.at[idx, k] = merge_additive(k, df.at[idx, k], v)
-                    elif missing(df.at[idx, k], rev):
-                        df.at[idx, k] = v
-                time.sleep(SLEEP)
-
-        # ───────── PR
-        row = df.loc[idx]
-        if any(missing(row[c], rev) for c in PR_COLS):
-            url = row.get("PR Link", "").strip()
-            if url.startswith("http") and (html := fetch(url)):
-                for k, v in parse_pr(html).items():
-                    if k in ADDITIVE_COLS:
-                        df.at[idx, k] = merge_additive(k, df.at[idx, k], v)
-                    elif missing(df.at[idx, k], rev):
-                        df.at[idx, k] = v
-                time.sleep(SLEEP)
-
-        # ───────── NM
-        row = df.loc[idx]
-        if any(missing(row[c], rev) for c in NM_COLS):
-            url = row.get("NM Link", "").strip()
-            if url.startswith("http") and (html := fetch(url)):
-                for k, v in parse_nm(html).items():
-                    if k in ADDITIVE_COLS:
-                        df.at[idx, k] = merge_additive(k, df.at[idx, k], v)
-                    elif missing(df.at[idx, k], rev):
-                        df.at[idx, k] = v
-                time.sleep(SLEEP)
-
-        # ───────── PN
-        row = df.loc[idx]
-        if any(missing(row[c], rev) for c in PN_COLS):
-            url = row.get("PN Link", "").strip()
-            if url.startswith("http") and (html := fetch(url)):
-                for k, v in parse_pn(html).items():
-                    if k in ADDITIVE_COLS:
-                        df.at[idx, k] = merge_additive(k, df.at[idx, k], v)
-                    elif missing(df.at[idx, k], rev):
-                        df.at[idx, k] = v
-                time.sleep(SLEEP)
-
-        # Clean + additive recheck
-        df.at[idx, "Sun"] = clean(df.at[idx, "Sun"])
-        df.at[idx, "Water"] = clean(df.at[idx, "Water"])
-        df.at[idx, "Tolerates"] = clean(df.at[idx, "Tolerates"])
-        df.at[idx, "Soil Description"] = clean(df.at[idx, "Soil Description"])
-        df.at[idx, "Bloom Time"] = merge_additive(
-            "Bloom Time", df.at[idx, "Bloom Time"], None
-        )
-        df.at[idx, "Bloom Color"] = merge_additive(
-            "Bloom Color", df.at[idx, "Bloom Color"], None
-        )
 
+def _finalise(df: pd.DataFrame, template_cols: list[str]) -> pd.DataFrame:
+    """Restore public column names and the master template's column order."""
     if "Zone" in df.columns:
         if "USDA Hardiness Zone" in df.columns:
             df["USDA Hardiness Zone"] = df["USDA Hardiness Zone"].where(
@@ -961,28 +2316,181 @@ def fill_csv(in_csv: Path, out_csv: Path, master_csv: Path) -> None:
         inplace=True,
     )
 
-    template_cols = list(
-        pd.read_csv(master_csv, nrows=0, keep_default_na=False).columns
-    )
     for c in template_cols:
         if c not in df.columns:
             df[c] = ""
-    df = df.loc[:, [c for c in template_cols if c in df.columns]]
+    return df.loc[:, [c for c in template_cols if c in df.columns]]
+
+
+def _saved(out_csv: Path) -> None:
+    """Print where the output went (repo-relative when possible)."""
+    try:
+        rel = out_csv.relative_to(REPO)
+    except ValueError:  # outside the repo - show full path
+        rel = out_csv
+    print(f"[OK] saved -> {rel}")
+
 
+MISS_COLS = ["URL", "Source", "Botanical Name", "Needed Columns"]
+
+
+def _write_misses(
+    misses: list[dict[str, str]], miss_report: Path, append: bool = False
+) -> None:
+    """Write (or append lines to) the --offline cache miss report."""
+    pd.DataFrame(misses, columns=MISS_COLS).to_csv(
+        miss_report,
+        mode="a" if append else "w",
+        header=not append,
+        index=False,
+        quoting=csv.QUOTE_ALL,
+    )
+
+
+def fill_chunked(
+    in_csv: Path,
+    out_csv: Path,
+    master_csv: Path,
+    chunksize: int,
+    jobs: int = 8,
+    parse_cache: bool = True,
+    use_async: bool = False,
+    workers: int = 1,
+    miss_report: Path | None = None,
+) -> None:
+    """fill_csv() for big lists: read, fill and append ``chunksize`` rows at a time."""
+    # * Only one chunk plus the Key column is ever held in memory; output and
+    # * miss report are appended per chunk (output via a temp file, so a crash
+    # * never leaves half a CSV)
+    cols = pd.read_csv(in_csv, nrows=0, keep_default_na=False).columns
+    used_keys: set[str] = set()
+    if "Key" in cols:
+        keys = pd.read_csv(in_csv, usecols=["Key"], dtype=str, keep_default_na=False)
+        used_keys = set(keys["Key"].astype(str))
+    else:
+        used_keys.add("")  # what fill_csv() sees for its blank Key column
+    template_cols = list(
+        pd.read_csv(master_csv, nrows=0, keep_default_na=False).columns
+    )
+
+    downloader = fetch_many_async if use_async and not OFFLINE else fetch_many
+    misses = 0
+    if miss_report:
+        _write_misses([], miss_report)  # header
+    cache = ParsedCache(enabled=parse_cache)
     out_csv.parent.mkdir(parents=True, exist_ok=True)
-    # // Ensure uniform quoting across all columns
-    df.to_csv(out_csv, index=False, quoting=csv.QUOTE_ALL, na_rep="")
-    print(f"[OK] saved -> {out_csv.relative_to(REPO)}")
+    tmp = out_csv.with_name(out_csv.name + ".part")
+    reader = pd.read_csv(in_csv, dtype=str, keep_default_na=False, chunksize=chunksize)
+    with open(tmp, "w", newline="", encoding="utf-8") as fh:
+        for n, chunk in enumerate(reader):
+            with STATS.timer("read csv"):
+                df = _prepare(chunk)
+            STATS.count("rows", len(df))
+            with STATS.timer("plan"):
+                plan = plan_fetches(df)
+            with STATS.timer("download"):
+                pages = downloader(list(dict.fromkeys(url for _, url in plan)), jobs)
+            if miss_report:
+                lines = cache_misses(df, plan, pages)
+                _write_misses(lines, miss_report, append=True)
+                misses += len(lines)
+            parsed = parse_pages(plan, pages, cache, workers)
+            del pages  # * drop this chunk's HTML before the next download
+            with STATS.timer("merge"):
+                apply_parsed(df, parsed, used_keys, cache)
+            with STATS.timer("checkpoint"):
+                cache.save()
+            with STATS.timer("write csv"):
+                _finalise(df, template_cols).to_csv(
+                    fh, header=n == 0, index=False, quoting=csv.QUOTE_ALL, na_rep=""
+                )
+        if not fh.tell():  # header-only input -> header-only output
+            empty = _prepare(pd.DataFrame(columns=cols, dtype=str))
+            _finalise(empty, template_cols).to_csv(
+                fh, index=False, quoting=csv.QUOTE_ALL
+            )
+    os.replace(tmp, out_csv)
+    _saved(out_csv)
+    if miss_report:
+        print(f"[OK] {misses} cache misses -> {miss_report}")
 
 
 # ────────────────────────── entrypoint ────────────────────────────────────
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # * --workers inside the PyInstaller EXE
+    # ! parse after freeze_support: spawned workers get --multiprocessing-fork argv
+    ARGS = parse_cli()
     if ARGS.diff:
         csv_diff(repo_path(ARGS.diff[0]), repo_path(ARGS.diff[1]))
         sys.exit()
 
-    fill_csv(
-        repo_path(ARGS.in_csv),
-        repo_path(ARGS.out_csv),
-        repo_path(ARGS.master_csv),
-    )
+    if ARGS.compress_cache:
+        n, before, after = CACHE.compress_all()
+        print(
+            f"[OK] compressed {n} pages: {before / 1e6:.1f} MB -> {after / 1e6:.1f} MB"
+        )
+        sys.exit()
+
+    if ARGS.cache_backend == "sqlite" or ARGS.import_cache:
+        CACHE = SqliteCache()
+    if ARGS.import_cache:
+        n = CACHE.import_dir()
+        print(f"[OK] imported {n} pages -> {CACHE.path.relative_to(REPO)}")
+        sys.exit()
+
+    THROTTLE.delay = ARGS.delay
+    POOL_SIZE, RETRIES = ARGS.pool_size, ARGS.retries
+    set_url_overrides(ARGS.base_url_override)
+    CACHE_TTL = ARGS.cache_ttl * 86400
+    OFFLINE = ARGS.offline
+    if ARGS.prefetch is not None:
+        src = repo_path(ARGS.prefetch or ARGS.in_csv)
+        found, todo, ok = prefetch(src, ARGS.jobs, ARGS.use_async)
+        print(f"[OK] prefetch: {found} links, {todo} not cached, {ok} downloaded")
+        CACHE.save()
+        sys.exit()
+    out_csv = repo_path(ARGS.out_csv)
+    report = out_csv.with_name(f"{out_csv.stem}_cache_misses.csv")
+    if ARGS.miss_report:
+        report = repo_path(ARGS.miss_report)
+    if ARGS.chunksize > 0:
+        if ARGS.resume or ARGS.incremental:
+            print("[!] --chunksize ignores --resume and --incremental")
+        fill_chunked(
+            repo_path(ARGS.in_csv),
+            out_csv,
+            repo_path(ARGS.master_csv),
+            ARGS.chunksize,
+            jobs=ARGS.jobs,
+            parse_cache=not ARGS.no_parse_cache,
+            use_async=ARGS.use_async,
+            workers=ARGS.workers,
+            miss_report=report if ARGS.offline or ARGS.miss_report else None,
+        )
+    else:
+        fill_csv(
+            repo_path(ARGS.in_csv),
+            out_csv,
+            repo_path(ARGS.master_csv),
+            jobs=ARGS.jobs,
+            parse_cache=not ARGS.no_parse_cache,
+            use_async=ARGS.use_async,
+            workers=ARGS.workers,
+            resume=ARGS.resume,
+            checkpoint_every=ARGS.checkpoint_every,
+            incremental=ARGS.incremental,
+            miss_report=report if ARGS.offline or ARGS.miss_report else None,
+        )
+    STATS.report()
+    if ARGS.stats_json:
+        repo_path(ARGS.stats_json).write_text(
+            json.dumps(STATS.as_dict(), indent=2), encoding="utf-8"
+        )
+        print(f"[OK] stats -> {ARGS.stats_json}")
+    if ARGS.memo_stats:
+        for name, (hits, misses, rate) in memo_stats().items():
+            print(f"[memo] {name:<20} {hits:>7} hits {misses:>6} misses {rate:>6.1%}")
+    if ARGS.cache_max_mb:
+        n, freed = CACHE.evict(int(ARGS.cache_max_mb * 1e6))
+        print(f"[OK] evicted {n} cached pages ({freed / 1e6:.1f} MB)")
+    CACHE.save()
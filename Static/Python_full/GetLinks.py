@@ -10,8 +10,12 @@ spinning up a headless Chrome session when necessary.
 """
 import sys
 import argparse
+import html
+import random
 import re
+import queue
 import subprocess
+import threading
 import time
 import json
 from pathlib import Path
@@ -19,8 +23,10 @@ from typing import Optional
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
-from urllib.parse import quote_plus
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote_plus, urljoin, urlparse
 
 # --- CLI ----------------------------------------------------------------
 parser = argparse.ArgumentParser(description="Fill missing plant site links")
@@ -31,6 +37,72 @@ parser.add_argument(
 )  # <- moved
 parser.add_argument("--chromedriver", default="", help="Path to chromedriver.exe")
 parser.add_argument("--chrome_binary", default="", help="Path to chrome.exe")
+parser.add_argument(
+    "--browsers",
+    type=int,
+    default=1,
+    help="Headless Chrome instances searching in parallel",
+)
+parser.add_argument(
+    "--delay",
+    type=float,
+    default=1.0,
+    help="Seconds between page loads on the same host (shared by all browsers, "
+    "except on Bing where each browser gets its own gap)",
+)
+parser.add_argument(
+    "--host_delay",
+    action="append",
+    metavar="DOMAIN=SECONDS",
+    help="Per-domain --delay, e.g. bing.com=3 (repeatable; subdomains included)",
+)
+parser.add_argument(
+    "--page_timeout",
+    type=float,
+    default=10,
+    help="Max seconds to wait for the Bing results list",
+)
+parser.add_argument(
+    "--http_first",
+    action="store_true",
+    help="Try the sites' own search pages over plain HTTP first; "
+    "start Chrome only for links still missing",
+)
+parser.add_argument(
+    "--http_jobs",
+    type=int,
+    default=8,
+    help="Concurrent HTTP searches / title checks",
+)
+parser.add_argument(
+    "--pool_size",
+    type=int,
+    default=4,
+    help="Keep-alive connections per host",
+)
+parser.add_argument(
+    "--retries",
+    type=int,
+    default=3,
+    help="Retries with exponential backoff on HTTP 429/5xx",
+)
+parser.add_argument(
+    "--cache_ttl",
+    type=float,
+    default=30,
+    help="Days before a cached search or page title is looked up again (0 = never)",
+)
+parser.add_argument(
+    "--no_query_cache",
+    action="store_true",
+    help="Ignore Outputs/link_cache.json and repeat every search",
+)
+parser.add_argument(
+    "--base_url_override",
+    action="append",
+    metavar="[HOST=]BASE",
+    help="Send HTTP requests to BASE/<host>/<path> (e.g. Tools/replay_server.py)",
+)
 args = parser.parse_args()
 
 # --- Repo layout & path helpers -----------------------------------------
@@ -110,6 +182,214 @@ PR_COL = "Link: Pleasantrunnursery.com"
 NM_COL = "Link: Newmoonnursery.com"
 PN_COL = "Link: Pinelandsnursery.com"
 
+# --- Pooled HTTP client ------------------------------------------------
+# * Same block lives in FillMissingData.py (each script ships as its own EXE);
+# * keep the two in step. Differences: that copy also counts STATS.* events
+POOL_SIZE = 4  # keep-alive connections kept open per host
+RETRIES = 3  # extra attempts after a 429 / 5xx answer
+BACKOFF = 1.0  # first backoff step in seconds (doubles every retry)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+URL_OVERRIDES: dict[str, str] = {}  # host ("*" = every host) -> replay base URL
+
+_SESSIONS: dict[str, requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def session_for(url: str) -> requests.Session:
+    """Return the keep-alive session for the URL's host (one per host)."""
+    host = urlparse(url).netloc.lower()
+    with _SESSIONS_LOCK:
+        if host not in _SESSIONS:
+            sess = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+            sess.mount("https://", adapter)
+            sess.mount("http://", adapter)
+            _SESSIONS[host] = sess
+        return _SESSIONS[host]
+
+
+def _backoff(attempt: int, retry_after: str | None) -> float:
+    """Exponential backoff with jitter, never shorter than Retry-After."""
+    delay = BACKOFF * 2**attempt + random.uniform(0, BACKOFF)
+    if retry_after and retry_after.strip().isdigit():
+        delay = max(delay, float(retry_after))
+    return delay
+
+
+def set_url_overrides(specs: list[str] | None) -> None:
+    """Load --base_url_override values, each BASE or HOST=BASE."""
+    for spec in specs or []:
+        host, _, base = spec.rpartition("=")
+        URL_OVERRIDES[host.lower() or "*"] = base.rstrip("/")
+
+
+def override_url(url: str) -> str:
+    """Map a site URL onto its replay server as BASE/<host>/<path>?<query>."""
+    if not URL_OVERRIDES:
+        return url
+    p = urlparse(url)
+    host = p.netloc.lower()
+    base = next(
+        (b for h, b in URL_OVERRIDES.items() if host == h or host.endswith("." + h)),
+        URL_OVERRIDES.get("*"),
+    )
+    if not base:
+        return url
+    return f"{base}/{p.netloc}{p.path or '/'}" + (f"?{p.query}" if p.query else "")
+
+
+def http_get(
+    url: str,
+    headers: dict[str, str] | None = None,
+    timeout: float = 12,
+    retries: int | None = None,
+    stream: bool = False,
+) -> requests.Response:
+    """
+    GET through the pooled session for the host.
+
+    403 -> retry once with HEADERS_ALT; 429/5xx -> back off and retry.
+    Network errors propagate to the caller like plain requests.get().
+    The request goes to override_url(url); callers keep the real URL.
+    With stream=True the body is left unread (the caller closes it).
+    """
+    extra = headers or {}
+    sess = session_for(url)
+    target = override_url(url)
+    retries = RETRIES if retries is None else retries
+    kw = {"timeout": timeout, "stream": stream}
+    for attempt in range(retries + 1):
+        r = sess.get(target, headers=HEADERS | extra, **kw)
+        if r.status_code == 403:
+            r.close()
+            r = sess.get(target, headers=HEADERS_ALT | extra, **kw)
+        if r.status_code not in RETRY_STATUS or attempt == retries:
+            break
+        r.close()
+        time.sleep(_backoff(attempt, r.headers.get("Retry-After")))
+    return r
+
+
+# --- Per-host throttle ------------------------------------------------
+# * Same class as in FillMissingData.py, which defaults delay to its SLEEP,
+# * records STATS and leaves per_host empty
+class HostThrottle:
+    """Space out network hits per host instead of one global sleep."""
+
+    def __init__(self, delay: float = 1.0, per_host: dict | None = None) -> None:
+        self.delay = delay
+        self.per_host: dict[str, float] = per_host or {}  # domain -> seconds
+        self._lock = threading.Lock()
+        self._next: dict[str, float] = {}
+
+    def delay_for(self, host: str) -> float:
+        """Politeness gap for a host: the most specific per-domain entry wins."""
+        # ? override this to plug in another policy (robots.txt, time of day...)
+        for dom in sorted(self.per_host, key=len, reverse=True):
+            if host == dom or host.endswith("." + dom):
+                return self.per_host[dom]
+        return self.delay
+
+    def reserve(self, url: str) -> float:
+        """Book the next slot for the URL's host -> seconds to wait for it."""
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next.get(host, 0.0))
+            self._next[host] = slot + self.delay_for(host)
+        return slot - now
+
+    def wait(self, url: str) -> None:
+        """Block until the host of ``url`` may be contacted again."""
+        # * Reserve the next slot under the lock, sleep outside of it
+        if (pause := self.reserve(url)) > 0:
+            time.sleep(pause)
+
+
+# --- Query / title cache -----------------------------------------------
+class LinkCache:
+    """
+    Search results and page titles from earlier runs ('Outputs/link_cache.json').
+
+    Sections: 'bing' (query -> result hrefs), 'html' (site search + name ->
+    link or None) and 'title' (URL -> page title). Every entry carries its
+    timestamp and is ignored once older than the TTL. Written every few new
+    entries, so a crashed run keeps what it already looked up.
+    """
+
+    SAVE_EVERY = 10  # new entries between saves
+
+    def __init__(self, path: Path, ttl: float = 0, enabled: bool = True) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.unsaved = 0
+        self.hits = self.misses = 0
+        self.data: dict[str, dict] = {"bing": {}, "html": {}, "title": {}}
+        if enabled and path.exists():
+            try:
+                self.data |= json.loads(path.read_text(encoding="utf-8"))
+            except Exception:
+                pass  # corrupted file? start over
+
+    def get(self, section: str, key: str) -> dict | None:
+        """Return the fresh entry for ``key`` or None."""
+        entry = self.data[section].get(key) if self.enabled else None
+        fresh = entry and (not self.ttl or time.time() - entry["at"] < self.ttl)
+        with self._lock:
+            if fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return entry if fresh else None
+
+    def put(self, section: str, key: str, **value) -> None:
+        """Store ``value`` (plus a timestamp) under ``key``."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.data[section][key] = {"at": time.time(), **value}
+            self.unsaved += 1
+            due = self.unsaved >= self.SAVE_EVERY
+        if due:
+            self.save()
+
+    def save(self) -> None:
+        """Write the cache atomically (ignore failures silently)."""
+        if not (self.enabled and self.unsaved):
+            return
+        tmp = self.path.with_suffix(".tmp")
+        try:
+            with self._lock:
+                tmp.write_text(json.dumps(self.data), encoding="utf-8")
+                self.unsaved = 0
+            tmp.replace(self.path)
+        except Exception:
+            pass
+
+
+POOL_SIZE, RETRIES = args.pool_size, args.retries
+set_url_overrides(args.base_url_override)
+THROTTLE = HostThrottle(
+    args.delay,
+    {
+        host.lower(): float(sec)
+        for host, _, sec in (spec.rpartition("=") for spec in args.host_delay or [])
+    },
+)
+LINK_CACHE = LinkCache(
+    REPO / "Outputs" / "link_cache.json",
+    ttl=args.cache_ttl * 86400,
+    enabled=not args.no_query_cache,
+)
+TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.I | re.S)
+TITLE_BYTES = 128 * 1024  # give up on a page's <title> after this much HTML
+TITLE_CANDIDATES = 3  # Bing hits per query whose titles are checked
+TITLE_POOL = ThreadPoolExecutor(max_workers=max(1, args.http_jobs))
+_LAST = threading.local()  # * per-thread: did the last safe_get() succeed?
+
+
 # --- Step 1: Load CSVs & prefill from master -----------------------------
 df = pd.read_csv(INPUT, dtype=str, keep_default_na=False).fillna("")
 
@@ -197,12 +477,13 @@ if needs.empty:
     print(f"All links present - written straight to {OUTPUT.relative_to(REPO)}")
     raise SystemExit
 
-# --- Step 3: only now import Selenium & start Chrome --------------------
+# --- Step 3: import Selenium (Chrome starts only once a search needs it) -
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, WebDriverException
 
 # where we look for a bundled chrome.exe
 PORT_DIRS = [STATIC / "GoogleChromePortable"]  # legacy
@@ -279,41 +560,63 @@ def find_driver() -> Path:
     )
 
 
-CHROME_EXE = find_chrome()
-DRV_EXE = find_driver()
-if not DRV_EXE.exists():
-    raise SystemExit(f"[ERROR] chromedriver not found at {DRV_EXE}")
+def start_browsers(n: int) -> list:
+    """Locate Chrome + chromedriver and launch ``n`` headless browsers."""
+    # * Only called when a search actually needs Chrome
+    chrome_exe = find_chrome()
+    drv_exe = find_driver()
+    if not drv_exe.exists():
+        raise SystemExit(f"[ERROR] chromedriver not found at {drv_exe}")
+
+    opt = Options()
+    opt.binary_location = str(chrome_exe)
+    try:
+        opt.add_argument("--headless=new")
+    except:
+        opt.add_argument("--headless")
+    opt.add_argument("--disable-gpu")
+    opt.add_argument("--blink-settings=imagesEnabled=false")
+    opt.page_load_strategy = "eager"  # * get() returns at DOMContentLoaded
+
+    def start(_) -> webdriver.Chrome:
+        try:
+            return webdriver.Chrome(service=Service(str(drv_exe)), options=opt)
+        except WebDriverException as e:
+            raise SystemExit(f"[ERROR] Selenium failed to start Chrome:\n{e}")
 
-opt = Options()
-opt.binary_location = str(CHROME_EXE)
-try:
-    opt.add_argument("--headless=new")
-except:
-    opt.add_argument("--headless")
-opt.add_argument("--disable-gpu")
-opt.add_argument("--blink-settings=imagesEnabled=false")
+    with ThreadPoolExecutor(max_workers=n) as pool:  # * start them side by side
+        return list(pool.map(start, range(n)))
 
-try:
-    driver = webdriver.Chrome(service=Service(str(DRV_EXE)), options=opt)
-except WebDriverException as e:
-    raise SystemExit(f"[ERROR] Selenium failed to start Chrome:\n{e}")
+
+def load(driver, url: str) -> None:
+    """driver.get() behind the per-host throttle (shared by every browser)."""
+    THROTTLE.wait(url)
+    driver.get(override_url(url))
+
+
+def wait_for(driver, cond, timeout: float | None = None) -> bool:
+    """Poll cond(driver) until truthy -> False once the timeout runs out."""
+    # // Replaces the old fixed time.sleep(1) after every page load
+    try:
+        WebDriverWait(driver, timeout or args.page_timeout, poll_frequency=0.1).until(
+            cond
+        )
+        return True
+    except TimeoutException:
+        return False
 
 
 # --- Helper functions ---------------------------------------------------
-def safe_get(url: str, retries=2, delay=2):
-    """HTTP GET with retries and user-agent fallbacks."""
-    # // Returns None on network failure
-    for _ in range(retries + 1):
-        try:
-            r = requests.get(url, headers=HEADERS, timeout=10)
-            if r.status_code == 403:
-                r = requests.get(url, headers=HEADERS_ALT, timeout=10)
-            if r.ok:
-                return r
-        except Exception:
-            pass
-        time.sleep(delay)
-    return None
+def safe_get(url: str):
+    """Throttled HTTP GET; http_get already retries 403 and 429/5xx."""
+    # // Returns None on network failure or a non-OK answer
+    THROTTLE.wait(url)
+    try:
+        r = http_get(url, timeout=10)
+    except Exception:
+        r = None
+    _LAST.ok = r is not None and r.ok
+    return r if _LAST.ok else None
 
 
 def name_variants(row):
@@ -326,22 +629,84 @@ def name_variants(row):
     return list(dict.fromkeys(v))
 
 
-def bing_link(q: str, include: str) -> Optional[str]:
-    """Return first Bing result containing a substring."""
-    # // Used when direct HTML search fails
-    driver.get(f"https://www.bing.com/search?q={quote_plus(q)}")
-    time.sleep(1)
-    for a in driver.find_elements(By.XPATH, '//li[@class="b_algo"]//a[@href]'):
-        href = a.get_attribute("href")
-        if include in href:
-            return href
+def bing_links(driver, q: str, include: str) -> list[str]:
+    """Return the Bing results containing a substring, in result order."""
+    # // The only step that still needs Chrome
+    if hit := LINK_CACHE.get("bing", q):
+        hrefs = hit["hrefs"]
+    else:
+        load(driver, f"https://www.bing.com/search?q={quote_plus(q)}")
+        # results list rendered, or page fully loaded without one (blocked)
+        wait_for(
+            driver,
+            lambda d: d.find_elements(By.ID, "b_results")
+            or d.execute_script("return document.readyState") == "complete",
+        )
+        hrefs = [
+            a.get_attribute("href")
+            for a in driver.find_elements(By.XPATH, '//li[@class="b_algo"]//a[@href]')
+        ]
+        # ? no results list at all = blocked / captcha page, don't remember it
+        if hrefs or driver.find_elements(By.ID, "b_results"):
+            LINK_CACHE.put("bing", q, hrefs=hrefs)
+    return list(dict.fromkeys(h for h in hrefs if include in h))
+
+
+def title_ok(title: str, botan: str) -> bool:
+    """Check if every word from botan name appears in the page title."""
+    # // Helps filter false-positive search results
+    return all(p.lower() in title.lower() for p in botan.split())
+
+
+def http_title(url: str) -> str:
+    """Page title from a streamed GET that stops at '</title>', cached by URL."""
+    # * No browser, no JavaScript, and usually only the first few KB of the page
+    if hit := LINK_CACHE.get("title", url):
+        return hit["title"]
+    THROTTLE.wait(url)
+    head = b""
+    try:
+        with http_get(url, timeout=10, stream=True) as r:
+            if not r.ok:
+                return ""
+            for chunk in r.iter_content(8192):
+                head += chunk
+                if b"</title>" in head.lower() or len(head) >= TITLE_BYTES:
+                    break
+            ctype = r.headers.get("Content-Type", "").lower()
+            enc = r.encoding if "charset" in ctype else "utf-8"
+    except requests.RequestException:
+        return ""  # not cached: try again next run
+    try:
+        text = head.decode(enc or "utf-8", errors="ignore")
+    except LookupError:
+        text = head.decode("utf-8", errors="ignore")  # // bogus charset header
+    m = TITLE_RE.search(text)
+    title = html.unescape(" ".join(m.group(1).split())) if m else ""
+    if title:
+        LINK_CACHE.put("title", url, title=title)
+    return title
+
+
+def first_titled(links: list[str], botan: str) -> Optional[str]:
+    """First of the top TITLE_CANDIDATES links whose title names the plant."""
+    # * Titles are fetched side by side; result order still decides the winner
+    links = links[:TITLE_CANDIDATES]
+    for link, title in zip(links, TITLE_POOL.map(http_title, links)):
+        if title_ok(title, botan):
+            return link
     return None
 
 
-def title_ok(botan: str) -> bool:
-    """Check if every word from botan name appears in browser title."""
-    # // Helps filter false-positive search results
-    return all(p.lower() in driver.title.lower() for p in botan.split())
+def cached_search(search, name: str) -> Optional[str]:
+    """Run a query_*_html() site search, reusing earlier answers."""
+    key = f"{search.__name__}:{name}"
+    if hit := LINK_CACHE.get("html", key):
+        return hit["link"]
+    link = search(name)
+    if getattr(_LAST, "ok", True):  # * never remember a network failure
+        LINK_CACHE.put("html", key, link=link)
+    return link
 
 
 def query_mbg_html(name: str) -> Optional[str]:
@@ -358,6 +723,21 @@ def query_mbg_html(name: str) -> Optional[str]:
             return "https://www.missouribotanicalgarden.org" + a["href"]
 
 
+def query_wf_html(name: str) -> Optional[str]:
+    """Scrape the Wildflower.org plant database search results."""
+    # // Result rows link to plants/result.php?id_plant=<USDA symbol>
+    url = (
+        "https://www.wildflower.org/plants/search.php?search_field="
+        + quote_plus(name)
+        + "&newsearch=true"
+    )
+    if r := safe_get(url):
+        soup = BeautifulSoup(r.text, "lxml")
+        a = soup.select_one("a[href*='result.php?id_plant=']")
+        if a and a.get("href"):
+            return urljoin("https://www.wildflower.org/plants/", a["href"])
+
+
 def query_pr_html(name: str) -> Optional[str]:
     """Scrape Pleasant Run Nursery search results."""
     # // Returns full URL when found
@@ -430,114 +810,149 @@ def query_pn_html(name: str) -> Optional[str]:
         return url
 
 
-# --- Search only rows that still need links -----------------------------
-for i, row in needs.iterrows():
+# --- Per-site search ---------------------------------------------------
+# (tag, column, Bing query, substring a hit must contain, site's own search)
+SITES = [
+    (
+        "MBG",
+        MBG_COL,
+        '"{}" site:missouribotanicalgarden.org',
+        "PlantFinderDetails.aspx",
+        query_mbg_html,
+    ),
+    (
+        "WF",
+        WF_COL,
+        '"{}" site:wildflower.org "plants/result.php"',
+        "wildflower.org/plants/result.php",
+        query_wf_html,
+    ),
+    (
+        "PR",
+        PR_COL,
+        '"{}" site:pleasantrunnursery.com',
+        "pleasantrunnursery.com",
+        query_pr_html,
+    ),
+    ("NM", NM_COL, '"{}" site:newmoonnursery.com', "newmoonnursery.com", query_nm_html),
+    (
+        "PN",
+        PN_COL,
+        '"{}" site:pinelandsnursery.com',
+        "pinelandsnursery.com",
+        query_pn_html,
+    ),
+]
+
+
+def search_site(driver, row, site) -> tuple[Optional[str], str]:
+    """Bing (title-checked) first, then the site's own search -> (link, log line)."""
+    tag, _, query, include, fallback = site
     bname = row["Botanical Name"]
-    have_mbg = row[MBG_COL].startswith("http")
-    have_wf = row[WF_COL].startswith("http")
-    have_pr = row[PR_COL].startswith("http")
-    have_nm = row[NM_COL].startswith("http")
-    have_pn = row[PN_COL].startswith("http")
-    print(f"Finding {bname}")
-
-    if not have_mbg:
+    for v in name_variants(row):
+        if link := first_titled(bing_links(driver, query.format(v), include), bname):
+            return link, f" {tag:<3} --> {link}"
+    if fallback:
         for v in name_variants(row):
-            if link := bing_link(
-                f'"{v}" site:missouribotanicalgarden.org', "PlantFinderDetails.aspx"
-            ):
-                driver.get(link)
-                time.sleep(1)
-                if title_ok(bname):
-                    df.at[i, MBG_COL] = link
-                    print(f" MBG --> {link}")
-                    break
-        else:
-            for v in name_variants(row):
-                if link := query_mbg_html(v):
-                    df.at[i, MBG_COL] = link
-                    print(f" MBG reused {link}")
-                    break
-            else:
-                print("  MBG not found")
+            if link := cached_search(fallback, v):
+                return link, f" {tag} reused {link}"
+    return None, f"  {tag} not found"
+
+
+def http_search(job) -> Optional[str]:
+    """Site's own search + title check on the fetched HTML, no browser."""
+    _, row, (_, _, _, _, search) = job
+    for v in name_variants(row):
+        link = cached_search(search, v)
+        if link and title_ok(http_title(link), row["Botanical Name"]):
+            return link
+    return None
 
-    if not have_wf:
-        for v in name_variants(row):
-            if link := bing_link(
-                f'"{v}" site:wildflower.org "plants/result.php"',
-                "wildflower.org/plants/result.php",
-            ):
-                driver.get(link)
-                time.sleep(1)
-                if title_ok(bname):
-                    df.at[i, WF_COL] = link
-                    print(f" WF  --> {link}")
-                    break
-        else:
-            print("  WF not found")
 
-    if not have_pr:
-        for v in name_variants(row):
-            if link := bing_link(
-                f'"{v}" site:pleasantrunnursery.com', "pleasantrunnursery.com"
-            ):
-                driver.get(link)
-                time.sleep(1)
-                if title_ok(bname):
-                    df.at[i, PR_COL] = link
-                    print(f" PR  --> {link}")
-                    break
-        else:
-            for v in name_variants(row):
-                if link := query_pr_html(v):
-                    df.at[i, PR_COL] = link
-                    print(f" PR reused {link}")
-                    break
-            else:
-                print("  PR not found")
+def search_worker(driver, jobs: queue.Queue, found: dict, lock) -> None:
+    """Drain (row index, row, site) jobs with one browser."""
+    while True:
+        try:
+            i, row, site = jobs.get_nowait()
+        except queue.Empty:
+            return
+        try:
+            link, msg = search_site(driver, row, site)
+        except WebDriverException as e:
+            link, msg = None, f"  {site[0]} failed: {e.msg}"
+        except Exception as e:  # ! a dead thread would silently drop the queue
+            link, msg = None, f"  {site[0]} failed: {e!r}"
+        with lock:
+            if link:
+                found[i, site[1]] = link
+            print(f"{row['Botanical Name']}:{msg}")
 
-    if not have_nm:
-        for v in name_variants(row):
-            if link := bing_link(
-                f'"{v}" site:newmoonnursery.com', "newmoonnursery.com"
-            ):
-                driver.get(link)
-                time.sleep(1)
-                if title_ok(bname):
-                    df.at[i, NM_COL] = link
-                    print(f" NM  --> {link}")
-                    break
-        else:
-            for v in name_variants(row):
-                if link := query_nm_html(v):
-                    df.at[i, NM_COL] = link
-                    print(f" NM reused {link}")
-                    break
-            else:
-                print("  NM not found")
 
-    if not have_pn:
-        for v in name_variants(row):
-            if link := bing_link(
-                f'"{v}" site:pinelandsnursery.com', "pinelandsnursery.com"
-            ):
-                driver.get(link)
-                time.sleep(1)
-                if title_ok(bname):
-                    df.at[i, PN_COL] = link
-                    print(f" PN  --> {link}")
-                    break
-        else:
-            for v in name_variants(row):
-                if link := query_pn_html(v):
-                    df.at[i, PN_COL] = link
-                    print(f" PN reused {link}")
-                    break
+# --- Search only rows that still need links -----------------------------
+# * Every (row, site) pair is its own job; the browsers share one queue and
+# * the per-host throttle, so a single site is never hit harder than before
+pending = [
+    (i, row, site)
+    for i, row in needs.iterrows()
+    for site in SITES
+    if not row[site[1]].startswith("http")
+]
+print(f"Searching {len(pending)} links for {len(needs)} plants")
+found: dict[tuple, str] = {}
+drivers: list = []
+try:
+    if args.http_first:
+        # * cheap pass: site searches over plain HTTP, Chrome only for the rest
+        with ThreadPoolExecutor(max_workers=max(1, args.http_jobs)) as pool:
+            links = list(pool.map(http_search, pending))
+        rest = []
+        for job, link in zip(pending, links):
+            i, row, site = job
+            if link:
+                found[i, site[1]] = link
+                print(f"{row['Botanical Name']}: {site[0]:<3} http {link}")
             else:
-                print("  PN not found")
-    time.sleep(1)
+                rest.append(job)
+        print(f"HTTP search found {len(found)} links; {len(rest)} left for Chrome")
+        pending = rest
+
+    if pending:
+        jobs: queue.Queue = queue.Queue()
+        for job in pending:
+            jobs.put(job)
+        n = max(1, min(args.browsers, len(pending)))
+        # * Every job starts on Bing: keep --delay per browser there so N
+        # * browsers can run N searches per --delay, unless --host_delay sets one
+        bing = "www.bing.com"
+        pinned = any(bing == d or bing.endswith("." + d) for d in THROTTLE.per_host)
+        if n > 1 and pinned:
+            print(
+                f"[!] --host_delay spaces Bing {THROTTLE.delay_for(bing):g} s apart "
+                f"for all {n} browsers; that gap caps the search rate"
+            )
+        elif n > 1:
+            THROTTLE.per_host["bing.com"] = args.delay / n
+        drivers = start_browsers(n)
+        lock = threading.Lock()
+        workers = [
+            threading.Thread(
+                target=search_worker, args=(d, jobs, found, lock), daemon=True
+            )
+            for d in drivers
+        ]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+finally:
+    LINK_CACHE.save()
+print(f"Query cache: {LINK_CACHE.hits} hits, {LINK_CACHE.misses} misses")
+for (i, col), link in found.items():
+    df.at[i, col] = link
 
 # --- Save & exit --------------------------------------------------------
-driver.quit()
+for d in drivers:
+    d.quit()
 df.rename(columns=reverse_map, inplace=True)
 template_cols = list(pd.read_csv(MASTER, nrows=0, keep_default_na=False).columns)
 df = df.reindex(
@@ -0,0 +1,231 @@
+# Tools/bench_parsers.py
+# Benchmark the FillMissingData site parsers on the pages in Outputs/html_cache
+#
+#   python Static/Tools/bench_parsers.py                      # time + golden check
+#   python Static/Tools/bench_parsers.py --json bench.json    # save the results
+#   python Static/Tools/bench_parsers.py --baseline bench.json
+#   python Static/Tools/bench_parsers.py --against old_FillMissingData.py
+#   python Static/Tools/bench_parsers.py --update_golden      # after a parser change
+#
+# Every run compares each page's parsed output with parser_golden.json, so a
+# speedup that changes results shows up as [DIFF] lines and exit code 1.
+# --against loads a second copy of the script (e.g. from `git show`), times its
+# parsers on the same pages and diffs their output too.
+
+import argparse
+import gzip
+import importlib.util
+import json
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[2]
+SCRIPT = REPO / "Static" / "Python_full" / "FillMissingData.py"
+GOLDEN = Path(__file__).resolve().with_name("parser_golden.json")
+CACHE_DIR = REPO / "Outputs" / "html_cache"
+
+# cache file names start with the host, so the host picks the parser
+HOSTS = {
+    "missouribotanicalgarden": "MBG",
+    "wildflower": "WF",
+    "pleasantrunnursery": "PR",
+    "newmoonnursery": "NM",
+    "pinelandsnursery": "PN",
+}
+
+
+def load_script(path: Path, name: str):
+    """Import a FillMissingData copy as a module without running its CLI."""
+    spec = importlib.util.spec_from_file_location(name, path)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[name] = mod
+    argv, sys.argv = sys.argv, [str(path)]  # the script parses argv on import
+    try:
+        spec.loader.exec_module(mod)
+    finally:
+        sys.argv = argv
+    return mod
+
+
+def read_page(f: Path) -> str:
+    """Read a cache file ('.html' or '.html.gz') like FillMissingData does."""
+    if f.suffix == ".gz":
+        return gzip.decompress(f.read_bytes()).decode("utf-8", errors="ignore")
+    return f.read_text(encoding="utf-8", errors="ignore")
+
+
+def load_pages(cache_dir: Path) -> dict[str, list[tuple[str, str]]]:
+    """Return {source tag: [(page name, html), ...]} from the page cache."""
+    pages: dict[str, list[tuple[str, str]]] = {}
+    for f in sorted(cache_dir.glob("*.html*")):
+        tag = next((t for host, t in HOSTS.items() if host in f.name), None)
+        if tag:
+            name = f.name.removesuffix(".gz")  # same key before/after gzipping
+            pages.setdefault(tag, []).append((name, read_page(f)))
+    return pages
+
+
+def parsers(mod) -> dict:
+    """The script's {source tag: parser}; older copies predate PARSERS."""
+    if hasattr(mod, "PARSERS"):
+        return mod.PARSERS
+    return {
+        "MBG": mod.parse_mbg,
+        "WF": lambda html: mod.parse_wf(html, want_fallback_sun_water=True),
+        "PR": mod.parse_pr,
+        "NM": mod.parse_nm,
+        "PN": mod.parse_pn,
+    }
+
+
+def run(mod, tag: str, pages: list[tuple[str, str]], repeat: int):
+    """Parse every page `repeat` times; return (per-call seconds, outputs)."""
+    parser = parsers(mod)[tag]
+    lat: list[float] = []
+    out = []
+    for _ in range(repeat):
+        out = []
+        for _, html in pages:
+            start = time.perf_counter()
+            out.append(parser(html))
+            lat.append(time.perf_counter() - start)
+    return lat, out
+
+
+def pct(values: list[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0..1)."""
+    ranked = sorted(values)
+    return ranked[min(len(ranked) - 1, int(q * len(ranked)))] if ranked else 0.0
+
+
+def summary(lat: list[float], pages: int) -> dict:
+    """Throughput and latency figures for one source."""
+    total = sum(lat)
+    return {
+        "pages": pages,
+        "calls": len(lat),
+        "seconds": round(total, 4),
+        "pages_per_s": round(len(lat) / total, 1) if total else 0.0,
+        "p50_ms": round(pct(lat, 0.50) * 1000, 3),
+        "p95_ms": round(pct(lat, 0.95) * 1000, 3),
+    }
+
+
+def git_commit() -> str:
+    """Short hash of the checked-out commit ('' outside git)."""
+    try:
+        out = subprocess.run(
+            ["git", "-C", str(REPO), "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+        )
+    except OSError:
+        return ""
+    return out.stdout.strip()
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark the site parsers")
+    ap.add_argument("--script", default=str(SCRIPT), help="FillMissingData.py")
+    ap.add_argument("--cache_dir", default=str(CACHE_DIR), help="Cached pages")
+    ap.add_argument("--against", help="Second copy to time and diff against")
+    ap.add_argument("--repeat", type=int, default=1, help="Passes over the pages")
+    ap.add_argument("--json", help="Write the results to this JSON file")
+    ap.add_argument("--baseline", help="Earlier --json file to compare pages/s with")
+    ap.add_argument("--golden", default=str(GOLDEN), help="Golden output snapshot")
+    ap.add_argument(
+        "--update_golden", action="store_true", help="Rewrite the golden snapshot"
+    )
+    args = ap.parse_args()
+
+    mod = load_script(Path(args.script), "fmd_bench")
+    ref = load_script(Path(args.against), "fmd_ref") if args.against else None
+    pages = load_pages(Path(args.cache_dir))
+    if not pages:
+        print(f"[!] No cached pages in {args.cache_dir}")
+        return 1
+    golden_path = Path(args.golden)
+    golden = (
+        json.loads(golden_path.read_text(encoding="utf-8"))
+        if golden_path.exists() and not args.update_golden
+        else {}
+    )
+    base = {}
+    if args.baseline:
+        base = json.loads(Path(args.baseline).read_text(encoding="utf-8"))["results"]
+
+    head = (
+        f"{'src':<4} {'pages':>5} {'sec':>7} {'pages/s':>8} {'p50 ms':>7} {'p95 ms':>7}"
+    )
+    head += f" {'vs base':>8}" if base else ""
+    head += f" {'ref sec':>8} {'speedup':>8}" if ref else ""
+    print(head)
+
+    results: dict[str, dict] = {}
+    outputs: dict[str, dict[str, dict]] = {}
+    diffs: list[tuple[str, str, str]] = []
+    for tag, items in pages.items():
+        lat, out = run(mod, tag, items, args.repeat)
+        res = results[tag] = summary(lat, len(items))
+        outputs[tag] = {name: data for (name, _), data in zip(items, out)}
+        line = (
+            f"{tag:<4} {len(items):>5} {res['seconds']:>7.2f} "
+            f"{res['pages_per_s']:>8.1f} {res['p50_ms']:>7.2f} {res['p95_ms']:>7.2f}"
+        )
+        if base:
+            old = base.get(tag, {}).get("pages_per_s")
+            line += f" {res['pages_per_s'] / old - 1:>+8.0%}" if old else f" {'-':>8}"
+        if ref:
+            ref_lat, ref_out = run(ref, tag, items, args.repeat)
+            line += f" {sum(ref_lat):>8.2f} {sum(ref_lat) / sum(lat):>7.1f}x"
+            diffs += [
+                ("against", tag, name)
+                for (name, _), a, b in zip(items, out, ref_out)
+                if a != b
+            ]
+        print(line)
+        for name, data in outputs[tag].items():
+            if tag in golden and golden[tag].get(name, data) != data:
+                diffs.append(("golden", tag, name))
+
+    for kind, tag, name in diffs:
+        print(f"[DIFF] {kind} {tag} {name}")
+    if golden:
+        checked = sum(n in golden.get(t, {}) for t, o in outputs.items() for n in o)
+        bad = sum(kind == "golden" for kind, _, _ in diffs)
+        print(
+            f"[OK] golden: {checked - bad} of {checked} pages match"
+            if not bad
+            else f"[!] golden: {bad} of {checked} pages differ"
+        )
+
+    if args.update_golden:
+        golden_path.write_text(
+            json.dumps(outputs, indent=1, sort_keys=True, ensure_ascii=False) + "\n",
+            encoding="utf-8",
+        )
+        print(f"[OK] golden snapshot -> {golden_path}")
+    if args.json:
+        Path(args.json).write_text(
+            json.dumps(
+                {
+                    "commit": git_commit(),
+                    "when": datetime.now().isoformat(timespec="seconds"),
+                    "python": platform.python_version(),
+                    "repeat": args.repeat,
+                    "results": results,
+                },
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+        print(f"[OK] results -> {args.json}")
+    return 1 if diffs else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
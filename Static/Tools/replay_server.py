@@ -0,0 +1,128 @@
+# Tools/replay_server.py
+# Serve cached plant-site pages over local HTTP for repeatable load tests
+#
+#   python Static/Tools/replay_server.py --port 8765 --latency 150 --rate_429 0.05
+#   python Static/Python_full/FillMissingData.py --base_url_override http://127.0.0.1:8765
+#
+# With --base_url_override the scripts request
+#   BASE/<host>/<path>?<query>    e.g. http://127.0.0.1:8765/www.wildflower.org/plants/...
+# and this server answers from Outputs/html_cache (or the SQLite cache) keyed by
+# the original https://<host>/<path>?<query> URL. Unknown pages get a 404.
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+from bench_parsers import SCRIPT, load_script
+
+
+def original_urls(path: str) -> list[str]:
+    """'/host/rest?q' -> the URLs the page may be cached under."""
+    urls = []
+    for p in dict.fromkeys((path, unquote(path))):  # links may hold raw spaces
+        host, _, rest = p.lstrip("/").partition("/")
+        urls += [f"{scheme}://{host}/{rest}" for scheme in ("https", "http")]
+    return urls
+
+
+def make_handler(cache, args, stats: Counter, lock: threading.Lock):
+    """Build the request handler bound to one cache and fault profile."""
+
+    class Replay(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, like the real sites
+
+        def _send(self, status: int, body: bytes, ctype: str, **headers) -> None:
+            with lock:
+                stats[status] += 1
+            self.send_response(status)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            for k, v in headers.items():
+                self.send_header(k.replace("_", "-"), v)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            if self.path == "/_stats":
+                body = json.dumps({str(k): v for k, v in stats.items()}).encode()
+                return self._send(200, body, "application/json")
+
+            # * fault injection first, so every page can fail the same way
+            if args.latency or args.jitter:
+                time.sleep(
+                    max(0.0, args.latency + random.uniform(0, args.jitter)) / 1000
+                )
+            roll = random.random()
+            if roll < args.rate_403:
+                return self._send(403, b"Forbidden", "text/plain")
+            roll -= args.rate_403
+            if roll < args.rate_429:
+                return self._send(
+                    429,
+                    b"Too Many Requests",
+                    "text/plain",
+                    Retry_After=args.retry_after,
+                )
+            roll -= args.rate_429
+            if roll < args.error_rate:
+                return self._send(503, b"Service Unavailable", "text/plain")
+
+            for url in original_urls(self.path):
+                if html := cache.get(url):
+                    return self._send(
+                        200, html.encode("utf-8"), "text/html; charset=utf-8"
+                    )
+            self._send(404, b"Not cached", "text/plain")
+
+        def log_message(self, fmt, *a) -> None:
+            if args.verbose:
+                super().log_message(fmt, *a)
+
+    return Replay
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Replay cached plant pages over HTTP")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--cache_backend", choices=("files", "sqlite"), default="files")
+    ap.add_argument(
+        "--latency", type=float, default=0, help="Base delay per request (ms)"
+    )
+    ap.add_argument(
+        "--jitter", type=float, default=0, help="Extra random delay up to (ms)"
+    )
+    ap.add_argument("--error_rate", type=float, default=0, help="Share of 503 answers")
+    ap.add_argument("--rate_403", type=float, default=0, help="Share of 403 answers")
+    ap.add_argument("--rate_429", type=float, default=0, help="Share of 429 answers")
+    ap.add_argument("--retry_after", default="1", help="Retry-After sent with 429s")
+    ap.add_argument("--seed", type=int, help="Seed the fault injection")
+    ap.add_argument("--verbose", action="store_true", help="Log every request")
+    args = ap.parse_args()
+
+    random.seed(args.seed)
+    fmd = load_script(SCRIPT, "fmd_replay")
+    cache = fmd.SqliteCache() if args.cache_backend == "sqlite" else fmd.CACHE
+    stats: Counter = Counter()
+    server = ThreadingHTTPServer(
+        (args.host, args.port), make_handler(cache, args, stats, threading.Lock())
+    )
+    print(
+        f"[OK] replaying {args.cache_backend} cache on http://{args.host}:{args.port}"
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    print(f"[OK] answered {dict(stats)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())